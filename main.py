@@ -4,24 +4,60 @@ Thể hiện MVC Pattern và các OOP principles
 """
 import pygame
 import sys
-from src.controllers.game_controller import GameController
+import logging
+from pygame import (QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEMOTION, VIDEOEXPOSE,
+                    NOEVENT, K_ESCAPE, K_SPACE, K_F11, FULLSCREEN)
 from src.controllers.menu_manager import MenuManager
-from src.views.game_view import GameView
 from src.views.level_select_view import LevelSelectView
 from src.views.game_result_view import GameResultView
 from src.views.intro_view import show_intro
 from src.utils.transition import fade_in, fade_out
+from src.utils.frame_timer import FrameTimer
+from src.utils.sound_manager import SoundManager
+from src.utils.progression_manager import ProgressionManager
 from src.models.base import Observer
-from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GameSettings, GameState, OwnerType
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GameSettings, GameState, OwnerType, AppState
+
+logger = logging.getLogger(__name__)
+
+# Cache các GameState/OwnerType hay so sánh trong event handlers
+_PLAYING = GameState.PLAYING
+_PAUSED = GameState.PAUSED
+_LEVEL_COMPLETE = GameState.LEVEL_COMPLETE
+_PLAYER = OwnerType.PLAYER
+
+# Bind các hàm event queue 1 lần lúc import - _handle_events gọi mỗi frame
+_event_pump = pygame.event.pump
+_event_peek = pygame.event.peek
+_event_get = pygame.event.get
+
+# Bảng trạng thái phím: SDL scancode nằm trong [0, 512)
+_KEY_STATE_SIZE = 512
+_KEYS_RELEASED = bytes(_KEY_STATE_SIZE)
 
 class TowerWarGame(Observer):
+    # Event types mỗi màn hình xử lý khi drain queue (MOUSEMOTION/MOUSEBUTTONDOWN
+    # được gộp riêng). KEYUP chỉ có ý nghĩa khi đang chơi
+    # VIDEOEXPOSE: cửa sổ bị che/hiện lại cần vẽ lại frame tĩnh
+    _MENU_EVENT_TYPES = [QUIT, KEYDOWN, VIDEOEXPOSE]
+    _STATE_EVENT_TYPES = {
+        AppState.MENU: _MENU_EVENT_TYPES,
+        AppState.LEVEL_SELECT: _MENU_EVENT_TYPES,
+        AppState.RESULT: _MENU_EVENT_TYPES,
+        AppState.GAME: [QUIT, KEYDOWN, KEYUP, VIDEOEXPOSE],
+    }
+    # Event types SDL cho vào queue theo từng màn hình - các loại khác bị bỏ ngay khi enqueue
+    _STATE_ALLOWED_EVENTS = {
+        state: types + [MOUSEBUTTONDOWN, MOUSEMOTION]
+        for state, types in _STATE_EVENT_TYPES.items()
+    }
+    
     def save_progression(self):
         """Lưu tiến trình game hiện tại"""
-        from src.utils.progression_manager import ProgressionManager
-        pm = ProgressionManager()
         data = {}
         data['current_level'] = self.current_level
-        if self.controller:
+        ctrl = self.controller
+        if ctrl:
             # Lưu trạng thái các tower
             data['towers'] = [
                 {
@@ -29,20 +65,20 @@ class TowerWarGame(Observer):
                     'y': t.y,
                     'owner': t.owner,
                     'troops': t.troops
-                } for t in getattr(self.controller, 'towers', [])
+                } for t in ctrl.towers
             ]
-            # Lưu trạng thái các troop
+            # Lưu trạng thái các troop - Troop luôn có count/target_position/is_dead
             data['troops'] = [
                 {
                     'x': tr.x,
                     'y': tr.y,
                     'owner': tr.owner,
-                    'count': getattr(tr, 'count', 1),
-                    'target_position': getattr(tr, 'target_position', (0,0)),
-                    'is_dead': getattr(tr, 'is_dead', False)
-                } for tr in getattr(self.controller, 'troops', [])
+                    'count': tr.count,
+                    'target_position': tr.target_position,
+                    'is_dead': tr.is_dead
+                } for tr in ctrl.troops
             ]
-        pm.save(data)
+        self._progression_manager.save(data)
     """
     Main game application class
     Thể hiện Facade Pattern - cung cấp interface đơn giản cho complex subsystem
@@ -58,7 +94,7 @@ class TowerWarGame(Observer):
             # Detect if we're in fullscreen mode by checking display flags
             current_size = screen.get_size()
             display_flags = pygame.display.get_surface().get_flags()
-            self.fullscreen = bool(display_flags & pygame.FULLSCREEN)
+            self.fullscreen = bool(display_flags & FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
             self.fullscreen = False
@@ -73,7 +109,7 @@ class TowerWarGame(Observer):
         self.offset_y = 0
         
         # Game loop components
-        self.clock = pygame.time.Clock()
+        self.clock = FrameTimer()  # perf_counter delta, dùng chung cho cả fade transitions
         self.running = True
         
         # Views
@@ -86,17 +122,91 @@ class TowerWarGame(Observer):
         self.view = None
         
         # Game state management
-        self.app_state = "menu"  # "menu", "level_select", "game", "result"
+        self.app_state = AppState.MENU
+        # Hàm xử lý 1 frame - chỉ chọn lại khi chuyển app_state, không kiểm tra mỗi frame
+        self._frame = self._run_menu_frame
+        self._accumulator = 0.0
+        self._setup_event_filter()
         self.current_level = 1
+        self._progression_manager = ProgressionManager()
         self.winner = None
         self.has_next_level = True
         self.result_shown = False  # Flag để tránh hiển thị result nhiều lần
         
         # Input handling
-        self.keys_pressed = set()
+        self.keys_pressed = bytearray(_KEY_STATE_SIZE)  # Trạng thái phím theo SDL scancode (1 = đang nhấn)
+        
+        # Dirty flag - màn hình tĩnh (menu, pause...) chỉ vẽ lại khi có input hoặc đổi state
+        self._dirty = True
+        self._last_rendered_state = None
+        self._full_redraw = True  # Lần present tiếp theo phải flip toàn màn hình
+        
+        # Capability của controller/view - resolve 1 lần khi tạo components
+        self._ctrl_has_pause = False
+        self._view_has_pause_menu = False
+        
+        # Dispatch tables - build một lần, mỗi event chỉ cần 1 lần tra dict
+        self._keydown_dispatch = {
+            K_ESCAPE: self._toggle_pause,  # ESC to pause/unpause game (not return to menu)
+            K_SPACE: self._toggle_pause,   # SPACE for alternative pause/unpause
+        }
+        self._game_event_dispatch = {
+            KEYDOWN: self._handle_keydown,
+            KEYUP: self._handle_keyup,
+            MOUSEBUTTONDOWN: self._handle_mouse_click,
+        }
+        self._event_dispatch = {
+            AppState.MENU: self._handle_menu_event,
+            AppState.LEVEL_SELECT: self._handle_level_select_event,
+            AppState.GAME: self._handle_game_event,
+            AppState.RESULT: self._handle_result_event,
+        }
+        self._update_dispatch = {
+            AppState.MENU: self._update_menu,
+            AppState.LEVEL_SELECT: self._update_level_select,
+            AppState.GAME: self._update_game,
+            AppState.RESULT: self._update_result,
+        }
+        # Màn hình tĩnh chỉ present lại vùng buttons (hover) khi không đổi state
+        self._dirty_rects_dispatch = {
+            AppState.MENU: self.menu_manager.get_dirty_rects,
+            AppState.LEVEL_SELECT: self.level_select_view.get_dirty_rects,
+            AppState.RESULT: self.game_result_view.get_dirty_rects,
+            AppState.GAME: self._get_game_dirty_rects,  # Chỉ dùng khi đang pause
+        }
+        self._render_dispatch = {
+            AppState.MENU: self._render_menu,
+            AppState.LEVEL_SELECT: self._render_level_select,
+            AppState.GAME: self._render_game,
+            AppState.RESULT: self._render_result,
+        }
+        # Action trả về từ menu/result views - mọi action đều fade_out trước khi gọi handler
+        self._menu_action_dispatch = {
+            "start_game": self.show_level_select,
+            "continue_game": self.load_progression,
+            "new_game": self._on_menu_new_game,
+            "quit": self._on_menu_quit,
+        }
+        self._result_action_dispatch = {
+            "next_level": self.start_next_level,
+            "play_again": self._on_result_play_again,
+            "main_menu": self.return_to_menu,
+        }
+        # Controller events main cần xử lý - các event khác chỉ đánh dấu dirty
+        self._observer_dispatch = {
+            "level_complete": self._on_level_complete,
+            "game_over": self._on_game_over,
+        }
+        self._ui_action_dispatch = {
+            "restart": self._on_ui_restart,
+            "resume": self._on_ui_resume,
+            "menu": self._on_ui_menu,
+            "toggle_sound": self._on_ui_toggle_sound,
+            "toggle_music": self._on_ui_toggle_music,
+        }
+        self._bind_state_handlers()
 
         # Music
-        from src.utils.sound_manager import SoundManager
         self.sound_manager = SoundManager()
         try:
             self.sound_manager.preload()
@@ -104,16 +214,24 @@ class TowerWarGame(Observer):
             # Continue without sound if there's an error
             pass
 
+    def _create_game_components(self):
+        """Tạo controller + view lần đầu cần tới - import muộn để menu đầu tiên hiện nhanh hơn"""
+        from src.controllers.game_controller import GameController
+        from src.views.game_view import GameView
+        
+        self.controller = GameController()
+        self.view = GameView(self.screen)
+        
+        # Setup Observer relationships
+        self.controller.attach(self.view)
+        self.controller.attach(self)  # Listen for game events
+        self._cache_component_capabilities()
+    
     def start_game(self, level=1):
         """Khởi tạo game components với level cụ thể"""
         if not self.controller:
             # Tạo game components khi cần (Lazy initialization)
-            self.controller = GameController()  
-            self.view = GameView(self.screen)   
-            
-            # Setup Observer relationships
-            self.controller.attach(self.view)
-            self.controller.attach(self)  # Listen for game events
+            self._create_game_components()
             
             # Update level select view với level manager reference
             self.level_select_view.level_manager = self.controller.level_manager
@@ -128,7 +246,7 @@ class TowerWarGame(Observer):
         # Switch from background music to gameview music
         self.sound_manager.play_gameview_music()
         
-        self.app_state = "game"
+        self._set_app_state(AppState.GAME)
         fade_in(self.screen, self.clock)
     
     def start_next_level(self):
@@ -142,7 +260,7 @@ class TowerWarGame(Observer):
             # Continue with gameview music for next level
             self.sound_manager.play_gameview_music()
             
-            self.app_state = "game"
+            self._set_app_state(AppState.GAME)
             fade_in(self.screen, self.clock)
         else:
             self.return_to_menu()
@@ -152,12 +270,7 @@ class TowerWarGame(Observer):
         # Đảm bảo controller và level manager đã được khởi tạo
         if not self.controller:
             # Initialize controller without starting gameview music
-            self.controller = GameController()  
-            self.view = GameView(self.screen)   
-            
-            # Setup Observer relationships
-            self.controller.attach(self.view)
-            self.controller.attach(self)  # Listen for game events
+            self._create_game_components()
             
             # Initialize with level 1
             self.controller.level_manager.set_level(1)
@@ -166,12 +279,10 @@ class TowerWarGame(Observer):
         # Cập nhật level manager reference cho level select view
         self.level_select_view.level_manager = self.controller.level_manager
         
-        # Don't restart music if already playing background music
-        if not (self.sound_manager.is_music_playing() and 
-                self.sound_manager.get_current_music_file() == "background_music.mp3"):
-            self.sound_manager.play_background_music()
+        # play_background_music tự bỏ qua nếu nhạc nền đang phát
+        self.sound_manager.play_background_music()
         
-        self.app_state = "level_select"
+        self._set_app_state(AppState.LEVEL_SELECT)
         fade_in(self.screen, self.clock)
     
     def show_result(self, winner, level, has_next_level):
@@ -179,7 +290,7 @@ class TowerWarGame(Observer):
         if self.result_shown:  # Tránh hiển thị nhiều lần
             return
             
-        self.app_state = "result"
+        self._set_app_state(AppState.RESULT)
         self.winner = winner
         self.current_level = level
         self.has_next_level = has_next_level
@@ -188,7 +299,7 @@ class TowerWarGame(Observer):
     
     def return_to_menu(self):
         """Quay về menu"""
-        self.app_state = "menu"
+        self._set_app_state(AppState.MENU)
         self.result_shown = False  # Reset flag
         self.menu_manager.reset_to_main()
         
@@ -199,26 +310,33 @@ class TowerWarGame(Observer):
     
     def update_observer(self, event_type: str, data: dict):
         """Observer implementation để nhận events từ game controller"""
+        # Controller event có thể đổi nội dung màn hình (kể cả khi đang pause)
+        self._dirty = True
         if self.result_shown:  # Nếu đã hiển thị result rồi thì bỏ qua
             return
-            
-        if event_type == "level_complete":
-            winner = data.get('winner')
-            level = data.get('level', self.current_level)
-            has_next = data.get('has_next_level', False)
-            
-            # Save progression khi hoàn thành level
-            if winner == OwnerType.PLAYER and has_next:
-                # Lưu level tiếp theo để player có thể continue từ đó
-                self.current_level = level + 1
-                self.save_progression()
-            
-            self.show_result(winner, level, has_next)
+        handler = self._observer_dispatch.get(event_type)
+        if handler:
+            handler(data)
+    
+    def _on_level_complete(self, data: dict):
+        """Controller event: hoàn thành level"""
+        winner = data.get('winner')
+        level = data.get('level', self.current_level)
+        has_next = data.get('has_next_level', False)
+        
+        # Save progression khi hoàn thành level
+        if winner == _PLAYER and has_next:
+            # Lưu level tiếp theo để player có thể continue từ đó
+            self.current_level = level + 1
+            self.save_progression()
         
-        elif event_type == "game_over":
-            winner = data.get('winner')
-            if winner != OwnerType.PLAYER:  # Player lost
-                self.show_result(winner, self.current_level, False)
+        self.show_result(winner, level, has_next)
+    
+    def _on_game_over(self, data: dict):
+        """Controller event: game over"""
+        winner = data.get('winner')
+        if winner != _PLAYER:  # Player lost
+            self.show_result(winner, self.current_level, False)
     
     def run(self):
         """
@@ -226,32 +344,25 @@ class TowerWarGame(Observer):
         Template Method Pattern - định nghĩa skeleton của game loop
         """
         # Start appropriate music based on initial state
-        if self.app_state == "menu":
+        if self.app_state == AppState.MENU:
             try:
-                if (not self.sound_manager.is_music_playing() or 
-                    self.sound_manager.get_current_music_file() != "background_music.mp3"):
-                    self.sound_manager.play_background_music()
+                self.sound_manager.play_background_music()
             except Exception as e:
                 pass
         
+        # Bind các hàm gọi mỗi frame thành local - tránh attribute lookup lặp lại
+        tick = self.clock.tick
+        target_fps = self._target_fps
+        
+        # Không bọc try trong từng frame - lỗi thoát vòng lặp, finally vẫn lưu + dọn dẹp
         try:
             while self.running:
-                try:
-                    # Calculate delta time
-                    dt = self.clock.tick(GameSettings.FPS) / 1000.0
-                    # Handle events
-                    self._handle_events()
-                    # Update game logic
-                    self._update(dt)
-                    # Render
-                    self._render(dt)
-                except Exception as e:
-                    import traceback
-                    traceback.print_exc()
-                    self.running = False
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
+                # Calculate delta time
+                dt = tick(target_fps()) / 1000.0
+                # Events + update + render của app state hiện tại
+                self._frame(dt)
+        except Exception:
+            logger.exception("Frame failure")
         finally:
             try:
                 self.save_progression()
@@ -259,75 +370,198 @@ class TowerWarGame(Observer):
                 pass
             self._cleanup()
     
-    def _handle_events(self):
+    def _cache_component_capabilities(self):
+        """Cache kết quả hasattr cho controller/view vừa tạo - không đổi sau khi khởi tạo"""
+        self._ctrl_has_pause = hasattr(self.controller, 'pause_game')
+        self._view_has_pause_menu = hasattr(self.view, 'pause_menu')
+    
+    def _set_app_state(self, state):
+        """Chuyển app state: chọn frame function và event filter tương ứng"""
+        self.app_state = state
+        if state == AppState.GAME:
+            self._enter_game_frame()
+        else:
+            self._frame = self._run_menu_frame
+        self._bind_state_handlers()
+        self._setup_event_filter()
+    
+    def _bind_state_handlers(self):
+        """Chọn sẵn handlers (events/update/render) của app state hiện tại - frame không tra bảng"""
+        state = self.app_state
+        self._state_event_types = self._STATE_EVENT_TYPES[state]
+        self._handle_state_event = self._event_dispatch[state]
+        self._update_state = self._update_dispatch[state]
+        self._render_state = self._render_dispatch[state]
+        self._state_dirty_rects = self._dirty_rects_dispatch[state]
+    
+    def _setup_event_filter(self):
+        """Block tất cả event types trừ những loại màn hình hiện tại xử lý"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._STATE_ALLOWED_EVENTS[self.app_state])
+    
+    def _target_fps(self):
+        """
+        FPS mục tiêu - chỉ chạy full FPS khi đang chơi, menu/pause dùng IDLE_FPS
+        """
+        ctrl = self.controller
+        if self.app_state == AppState.GAME and ctrl and ctrl.game_state == _PLAYING:
+            return GameSettings.FPS
+        return GameSettings.IDLE_FPS
+    
+    def _enter_game_frame(self):
+        """Chuyển sang game frame, bỏ thời gian tích lũy từ trước"""
+        self._frame = self._run_game_frame
+        self._accumulator = 0.0
+        # KEYUP bị bỏ qua ngoài game - reset trạng thái phím khi vào game
+        self.keys_pressed[:] = _KEYS_RELEASED
+    
+    def _run_menu_frame(self, dt):
+        """Frame cho menu, level select, result - update theo dt thực"""
+        first_event = None
+        # Không có gì cần vẽ lại - để OS cho process ngủ tới khi có input
+        if not self._dirty and self._render_key() == self._last_rendered_state:
+            event = pygame.event.wait(GameSettings.IDLE_EVENT_TIMEOUT)
+            if event.type != NOEVENT:
+                # Không post lại (sẽ xuống cuối queue) - event đến trước nhất nên xử lý đầu tiên
+                first_event = event
+        self._handle_events(first_event)
+        self._update_state(dt)
+        self._render(dt)
+    
+    def _run_game_frame(self, dt):
+        """
+        Frame cho gameplay
+        Fixed timestep: logic update theo bước cố định, render 1 lần mỗi frame
+        """
+        self._handle_events()
+        # Clamp dt để frame chậm không gây update dồn
+        accumulator = self._accumulator + min(dt, GameSettings.MAX_FRAME_TIME)
+        fixed_dt = GameSettings.FIXED_TIMESTEP
+        update = self._update_state
+        while accumulator >= fixed_dt:
+            update(fixed_dt)
+            accumulator -= fixed_dt
+        self._accumulator = accumulator
+        self._render(dt)
+    
+    def _handle_events(self, first_event=None):
         """
         Handle all pygame events based on app state
+        first_event: event đã lấy ra bằng event.wait - xử lý trước các event còn trong queue
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.save_progression()
+        get_events = _event_get
+        
+        # Pump SDL đúng 1 lần mỗi frame, các lần get sau không pump lại
+        _event_pump()
+        # Frame không có input (thường gặp khi idle) - bỏ qua các lần get/clear và dispatch
+        if first_event is None and _event_peek(pump=False).type == NOEVENT:
+            return
+        
+        # Drain cả queue 1 lần theo đúng thứ tự đến - event màn hình hiện tại không dùng bị bỏ
+        app_state = self.app_state
+        state_event_types = self._state_event_types
+        events = []
+        last_motion = None  # Gộp MOUSEMOTION: chỉ xử lý vị trí chuột cuối cùng của frame
+        click_index = -1  # Chỉ hit-test 1 click trái mỗi frame, giữ ở vị trí nó đến trong queue
+        queued = get_events(pump=False)
+        if first_event is not None:
+            queued.insert(0, first_event)
+        for event in queued:
+            event_type = event.type
+            if event_type == MOUSEMOTION:
+                last_motion = event
+            elif event_type == MOUSEBUTTONDOWN:
+                if event.button == 1:  # Các handler đều bỏ qua nút khác
+                    if click_index >= 0:
+                        del events[click_index]
+                    click_index = len(events)
+                    events.append(event)
+            elif event_type in state_event_types:
+                events.append(event)
+        if last_motion is not None and app_state != AppState.GAME:
+            # Menu screens xử lý hover qua handle_event như event thường
+            events.insert(0, last_motion)
+        if events or last_motion is not None:
+            self._dirty = True
+        
+        # Handler theo màn hình - bind khi đổi state, vòng lặp dừng khi app_state đổi
+        handle_state_event = self._handle_state_event
+        
+        for event in events:
+            event_type = event.type
+            if event_type == QUIT:
+                # Progression được lưu 1 lần trong finally của run()
                 self.running = False
+                return  # Không cần xử lý các event còn lại (kể cả flush chuột) khi thoát
             # Handle F11 globally across all states
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            if event_type == KEYDOWN and event.key == K_F11:
                 self.toggle_fullscreen()
                 continue
+            if event_type == VIDEOEXPOSE:
+                self._full_redraw = True
+                continue
             
-            # Pass events directly without scaling
-            scaled_event = event
-            if self.app_state == "menu":
-                action = self.menu_manager.handle_event(scaled_event)
-                if action == "start_game":
-                    fade_out(self.screen, self.clock)
-                    self.show_level_select()
-                elif action == "continue_game":
-                    fade_out(self.screen, self.clock)
-                    self.load_progression()
-                elif action == "new_game":
-                    fade_out(self.screen, self.clock)
-                    self.reset_progression()
-                    self.show_level_select()
-                elif action == "quit":
-                    fade_out(self.screen, self.clock)
-                    self.running = False
-            elif self.app_state == "level_select":
-                # Level selection events
-                action = self.level_select_view.handle_event(scaled_event)
-                if action and action.startswith("level_"):
-                    level = int(action.split("_")[1])
-                    fade_out(self.screen, self.clock)
-                    self.start_game(level)
-                elif action == "back_to_menu":
-                    fade_out(self.screen, self.clock)
-                    self.return_to_menu()
-            elif self.app_state == "result":
-                # Game result events
-                action = self.game_result_view.handle_event(scaled_event)
-                if action == "next_level":
-                    fade_out(self.screen, self.clock)
-                    self.start_next_level()
-                elif action == "play_again":
-                    self.result_shown = False  # Reset flag
-                    fade_out(self.screen, self.clock)
-                    self.start_game(self.current_level)
-                elif action == "main_menu":
-                    fade_out(self.screen, self.clock)
-                    self.return_to_menu()
-            elif self.app_state == "game":
-                # Game events
-                if scaled_event.type == pygame.KEYDOWN:
-                    self._handle_keydown(scaled_event)
-                elif scaled_event.type == pygame.KEYUP:
-                    self._handle_keyup(scaled_event)
-                elif scaled_event.type == pygame.MOUSEBUTTONDOWN:
-                    self._handle_mouse_click(scaled_event)
-                elif scaled_event.type == pygame.MOUSEMOTION:
-                    self._handle_mouse_motion(scaled_event)
+            handle_state_event(event)
+            
+            # Đã thoát - bỏ qua mọi thứ còn lại của frame
+            if not self.running:
+                return
+            # Chuyển màn hình - các event còn lại thuộc màn hình cũ, bỏ qua
+            if self.app_state != app_state:
+                break
+        
+        # Cập nhật view đúng 1 lần mỗi frame với vị trí chuột mới nhất
+        if last_motion is not None and app_state == AppState.GAME:
+            self._flush_mouse_motion(last_motion.pos)
 
+    def _handle_menu_event(self, event):
+        """Menu events"""
+        handler = self._menu_action_dispatch.get(self.menu_manager.handle_event(event))
+        if handler:
+            fade_out(self.screen, self.clock)
+            handler()
+    
+    def _handle_level_select_event(self, event):
+        """Level selection events"""
+        action = self.level_select_view.handle_event(event)
+        if action and action.startswith("level_"):
+            level = int(action.split("_")[1])
+            fade_out(self.screen, self.clock)
+            self.start_game(level)
+        elif action == "back_to_menu":
+            fade_out(self.screen, self.clock)
+            self.return_to_menu()
+    
+    def _handle_result_event(self, event):
+        """Game result events"""
+        handler = self._result_action_dispatch.get(self.game_result_view.handle_event(event))
+        if handler:
+            fade_out(self.screen, self.clock)
+            handler()
+    
+    def _on_menu_new_game(self):
+        """Menu action: xóa progression rồi chọn level"""
+        self.reset_progression()
+        self.show_level_select()
+    
+    def _on_menu_quit(self):
+        """Menu action: thoát game"""
+        self.running = False
+    
+    def _on_result_play_again(self):
+        """Result action: chơi lại level hiện tại"""
+        self.result_shown = False  # Reset flag
+        self.start_game(self.current_level)
+    
+    def _handle_game_event(self, event):
+        """Game events - tra bảng theo event type thay vì chuỗi if/elif"""
+        handler = self._game_event_dispatch.get(event.type)
+        if handler:
+            handler(event)
+    
     def load_progression(self):
         """Tải tiến trình đã lưu và bắt đầu game ở level đã lưu"""
-        from src.utils.progression_manager import ProgressionManager
-        pm = ProgressionManager()
-        data = pm.load()
+        data = self._progression_manager.load()
         if not data:
             # Nếu không có data, chuyển về level select
             self.show_level_select()
@@ -339,50 +573,46 @@ class TowerWarGame(Observer):
 
     def reset_progression(self):
         """Xóa file progression để bắt đầu game mới"""
-        from src.utils.progression_manager import ProgressionManager
-        import os
-        pm = ProgressionManager()
-        if os.path.exists(pm.save_path):
-            os.remove(pm.save_path)
+        self._progression_manager.clear()
     
     def _handle_keydown(self, event):
         """Handle key press events"""
-        self.keys_pressed.add(event.key)
+        scancode = event.scancode
+        if scancode < _KEY_STATE_SIZE:
+            self.keys_pressed[scancode] = 1
         
         # Game controls (only if game is active)
-        if not self.controller:
+        ctrl = self.controller
+        if not ctrl:
             return
         
-        # ESC to pause/unpause game (not return to menu)
-        if event.key == pygame.K_ESCAPE:
-            if self.controller.game_state == GameState.PLAYING:
-                self.controller.pause_game()
-                if self.view:
-                    # Sync current sound settings to pause menu
-                    self._sync_sound_settings_to_pause_menu()
-                    self.view.show_pause_menu()
-            elif self.controller.game_state == GameState.PAUSED:
-                self.controller.pause_game()
-                if self.view:
-                    self.view.hide_pause_menu()
+        # Handle level complete inputs (ESC vẫn dùng để pause/unpause)
+        key = event.key
+        if key != K_ESCAPE and ctrl.game_state == _LEVEL_COMPLETE:
+            ctrl.handle_level_complete_input(key)
             return
         
-        # Handle level complete inputs
-        elif self.controller.game_state == GameState.LEVEL_COMPLETE:
-            self.controller.handle_level_complete_input(event.key)
-        
-        # SPACE for alternative pause/unpause
-        elif event.key == pygame.K_SPACE:
-            if self.controller.game_state == GameState.PLAYING:
-                self.controller.pause_game()
-                if self.view:
-                    # Sync current sound settings to pause menu
-                    self._sync_sound_settings_to_pause_menu()
-                    self.view.show_pause_menu()
-            elif self.controller.game_state == GameState.PAUSED:
-                self.controller.pause_game()
-                if self.view:
-                    self.view.hide_pause_menu()
+        handler = self._keydown_dispatch.get(key)
+        if handler:
+            handler()
+    
+    def _toggle_pause(self):
+        """Pause/unpause game và hiện/ẩn pause menu"""
+        ctrl = self.controller
+        if ctrl is None:
+            return
+        view = self.view
+        state = ctrl.game_state
+        if state == _PLAYING:
+            ctrl.pause_game()
+            if view:
+                # Sync current sound settings to pause menu
+                self._sync_sound_settings_to_pause_menu()
+                view.show_pause_menu()
+        elif state == _PAUSED:
+            ctrl.pause_game()
+            if view:
+                view.hide_pause_menu()
     
     def _sync_sound_settings_to_pause_menu(self):
         """Sync current sound settings to pause menu"""
@@ -393,164 +623,192 @@ class TowerWarGame(Observer):
     
     def _handle_keyup(self, event):
         """Handle key release events"""
-        if event.key in self.keys_pressed:
-            self.keys_pressed.remove(event.key)
+        scancode = event.scancode
+        if scancode < _KEY_STATE_SIZE:
+            self.keys_pressed[scancode] = 0
     
     def _handle_mouse_click(self, event):
         """Handle mouse click events"""
-        if event.button == 1:  # Left click
-            if self.controller and self.view:
-                # Translate mouse coordinates for UI clicks
-                scale_factor = self.view.scale_factor
-                offset_x = getattr(self.view, 'offset_x', 0)
-                offset_y = getattr(self.view, 'offset_y', 0)
-                
-                # Translate mouse coordinates from screen to game coordinates
-                mouse_x = event.pos[0] - offset_x
-                mouse_y = event.pos[1] - offset_y
-                translated_x = mouse_x / scale_factor
-                translated_y = mouse_y / scale_factor
-                
-                # Use translated coordinates for UI if within game area
-                if (0 <= translated_x <= SCREEN_WIDTH and 0 <= translated_y <= SCREEN_HEIGHT):
-                    ui_pos = (translated_x, translated_y)
-                else:
-                    ui_pos = event.pos
-                
-                # Check UI clicks first - but only if pause menu is visible when paused
-                ui_action = None
-                if (self.controller.game_state == GameState.PAUSED and 
-                    hasattr(self.view, 'pause_menu_visible') and 
-                    self.view.pause_menu_visible):
-                    # Only handle pause menu UI clicks when visible
-                    ui_action = self.view.handle_ui_click(ui_pos)
-                elif self.controller.game_state != GameState.PAUSED:
-                    # Handle other UI clicks when not paused
-                    ui_action = self.view.handle_ui_click(ui_pos)
-                
-                if ui_action == "restart":
-                    # Hide pause menu first
-                    if self.view:
-                        self.view.hide_pause_menu()
-                    self.result_shown = False  # Reset flag
-                    self.controller.restart_game()
-                    # Ensure gameview music is playing
-                    self.sound_manager.play_gameview_music()
-                elif ui_action == "resume":
-                    if hasattr(self.controller, 'pause_game'):
-                        self.controller.pause_game()  # This will unpause
-                        if self.view:
-                            self.view.hide_pause_menu()  # Hide pause menu when resuming
-                elif ui_action == "menu":
-                    fade_out(self.screen, self.clock)
-                    self.return_to_menu()
-                elif ui_action == "toggle_sound":
-                    # Toggle sound effects in pause menu
-                    if self.view and hasattr(self.view, 'pause_menu'):
-                        self.view.pause_menu.sound_enabled = not self.view.pause_menu.sound_enabled
-                        # Update sound manager (use the instance)
-                        if self.view.pause_menu.sound_enabled:
-                            self.sound_manager.set_sfx_volume(0.7)
-                        else:
-                            self.sound_manager.set_sfx_volume(0.0)
-                        # Sync back to menu manager
-                        self.menu_manager.settings_menu.sound_enabled = self.view.pause_menu.sound_enabled
-                elif ui_action == "toggle_music":
-                    # Toggle background music in pause menu
-                    if self.view and hasattr(self.view, 'pause_menu'):
-                        self.view.pause_menu.music_enabled = not self.view.pause_menu.music_enabled
-                        # Update sound manager (use the instance)
-                        if self.view.pause_menu.music_enabled:
-                            self.sound_manager.set_music_volume(0.5)
-                        else:
-                            self.sound_manager.set_music_volume(0.0)
-                    # Sync back to menu manager
-                    self.menu_manager.settings_menu.music_enabled = self.view.pause_menu.music_enabled
-                elif ui_action is None or ui_action == "none":
-                    # Game click - only if not paused
-                    if self.controller.game_state == GameState.PLAYING:
-                        # Use the same translated coordinates from UI click handling
-                        if (0 <= translated_x <= SCREEN_WIDTH and 0 <= translated_y <= SCREEN_HEIGHT):
-                            self.controller.handle_click((translated_x, translated_y))
-                        else:
-                            # Fallback to original coordinates if translation failed
-                            self.controller.handle_click(event.pos)
-    
-    def _handle_mouse_motion(self, event):
-        """Handle mouse motion events"""
+        if event.button != 1:  # Left click only
+            return
+        ctrl = self.controller
+        view = self.view
+        if not (ctrl and view):
+            return
+        
+        # Translate mouse coordinates from screen to game coordinates
+        game_pos = self._to_game_pos(event.pos)
+        
+        # Check UI clicks first - but only if pause menu is visible when paused
+        state = ctrl.game_state
+        ui_action = None
+        if state == _PAUSED:
+            # Only handle pause menu UI clicks when visible
+            if view.pause_menu_visible:
+                ui_action = view.handle_ui_click(game_pos)
+        else:
+            # Handle other UI clicks when not paused
+            ui_action = view.handle_ui_click(game_pos)
+        
+        handler = self._ui_action_dispatch.get(ui_action)
+        if handler:
+            handler()
+        elif ui_action is None or ui_action == "none":
+            # Game click - only if not paused
+            if state == _PLAYING:
+                # Use the same translated coordinates from UI click handling
+                ctrl.handle_click(game_pos)
+    
+    def _on_ui_restart(self):
+        """UI action: restart level hiện tại"""
+        # Hide pause menu first
         if self.view:
-            # Translate mouse coordinates for UI elements in fullscreen mode
-            scale_factor = self.view.scale_factor
-            offset_x = getattr(self.view, 'offset_x', 0)
-            offset_y = getattr(self.view, 'offset_y', 0)
-            
-            # Translate mouse coordinates from screen to game coordinates
-            mouse_x = event.pos[0] - offset_x
-            mouse_y = event.pos[1] - offset_y
-            translated_x = mouse_x / scale_factor
-            translated_y = mouse_y / scale_factor
-            
-            # Only update if within game area, otherwise use original coordinates
-            if (0 <= translated_x <= SCREEN_WIDTH and 0 <= translated_y <= SCREEN_HEIGHT):
-                self.view.update_mouse_position((translated_x, translated_y))
+            self.view.hide_pause_menu()
+        self.result_shown = False  # Reset flag
+        self.controller.restart_game()
+        # Ensure gameview music is playing
+        self.sound_manager.play_gameview_music()
+    
+    def _on_ui_resume(self):
+        """UI action: tiếp tục game từ pause menu"""
+        if self._ctrl_has_pause:
+            self.controller.pause_game()  # This will unpause
+            if self.view:
+                self.view.hide_pause_menu()  # Hide pause menu when resuming
+    
+    def _on_ui_menu(self):
+        """UI action: quay về main menu"""
+        fade_out(self.screen, self.clock)
+        self.return_to_menu()
+    
+    def _on_ui_toggle_sound(self):
+        """UI action: toggle sound effects in pause menu"""
+        if self.view and self._view_has_pause_menu:
+            self.view.pause_menu.sound_enabled = not self.view.pause_menu.sound_enabled
+            # Update sound manager (use the instance)
+            if self.view.pause_menu.sound_enabled:
+                self.sound_manager.set_sfx_volume(0.7)
+            else:
+                self.sound_manager.set_sfx_volume(0.0)
+            # Sync back to menu manager
+            self.menu_manager.settings_menu.sound_enabled = self.view.pause_menu.sound_enabled
+    
+    def _on_ui_toggle_music(self):
+        """UI action: toggle background music in pause menu"""
+        if self.view and self._view_has_pause_menu:
+            self.view.pause_menu.music_enabled = not self.view.pause_menu.music_enabled
+            # Update sound manager (use the instance)
+            if self.view.pause_menu.music_enabled:
+                self.sound_manager.set_music_volume(0.5)
             else:
-                self.view.update_mouse_position(event.pos)
+                self.sound_manager.set_music_volume(0.0)
+        # Sync back to menu manager
+        self.menu_manager.settings_menu.music_enabled = self.view.pause_menu.music_enabled
     
-    def _update(self, dt):
+    def _flush_mouse_motion(self, pos):
+        """Cập nhật mouse position cho view"""
+        if self.view:
+            self.view.update_mouse_position(self._to_game_pos(pos))
+    
+    def _to_game_pos(self, pos):
         """
-        Update game state based on app state
+        Đổi tọa độ chuột từ screen sang game (fullscreen có scale + offset).
+        Nằm ngoài vùng game thì trả lại tọa độ gốc.
         """
-        if self.app_state == "menu":
-            self.menu_manager.update(dt)
-            
-        elif self.app_state == "level_select":
-            self.level_select_view.update(dt)
-            
-        elif self.app_state == "game":
-            if self.controller:
-                # Chỉ update game nếu không ở trạng thái level complete
-                if self.controller.game_state != GameState.LEVEL_COMPLETE:
-                    self.controller.update(dt)
-                
-        elif self.app_state == "result":
-            self.game_result_view.update(dt)
+        # Windowed: screen trùng kích thước game (scale 1, không offset) - không cần đổi
+        if not self.fullscreen:
+            return pos
+        view = self.view
+        inv_scale = view.inv_scale_factor
+        x = (pos[0] - view.offset_x) * inv_scale
+        y = (pos[1] - view.offset_y) * inv_scale
+        if 0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT:
+            return (x, y)
+        return pos
+    
+    def _update_menu(self, dt):
+        """Update menu"""
+        self.menu_manager.update(dt)
+    
+    def _update_level_select(self, dt):
+        """Update level selection"""
+        self.level_select_view.update(dt)
+    
+    def _update_game(self, dt):
+        """Update game logic"""
+        ctrl = self.controller
+        # Chỉ update game nếu không ở trạng thái level complete
+        if ctrl and ctrl.game_state != _LEVEL_COMPLETE:
+            ctrl.update(dt)
+    
+    def _update_result(self, dt):
+        """Update game result animations"""
+        self.game_result_view.update(dt)
     
     def _render(self, dt):
         """
         Render current frame based on app state
         """
-        # Clear screen
-        self.screen.fill((0, 0, 0))
+        # Màn hình tĩnh không có gì thay đổi - bỏ qua draw/flip
+        render_state = self._render_key()
+        state_changed = render_state != self._last_rendered_state
+        # Menu, level select, result và pause chỉ thay đổi khi có input
+        is_static = self.app_state != AppState.GAME or render_state == _PAUSED
+        if not self._dirty and not state_changed and is_static:
+            return
+        self._dirty = False
+        self._last_rendered_state = render_state
         
-        if self.app_state == "menu":
-            # Render menu
-            self.menu_manager.render(self.screen)
-            
-        elif self.app_state == "level_select":
-            # Render level selection
-            self.level_select_view.draw(self.screen)
-            
-        elif self.app_state == "game":
-            # Render game
-            if self.view:
-                self.view.draw(dt)
-                    
-        elif self.app_state == "result":
-            # Render game result - don't draw game view to prevent flickering
-            # Clear screen with black background
-            self.screen.fill((0, 0, 0))
-            
-            # Draw result overlay only
-            if self.winner == OwnerType.PLAYER:
-                all_complete = self.current_level >= 3 and not self.has_next_level
-                self.game_result_view.draw_win_screen(
-                    self.screen, self.current_level, self.has_next_level, all_complete
-                )
-            else:
-                self.game_result_view.draw_lose_screen(self.screen, self.current_level)
+        # Không fill trước - mỗi màn hình tự phủ kín screen (background/fill riêng)
+        self._render_state(dt)
         
-        # Update display
-        pygame.display.flip()
+        # Update display - màn hình tĩnh không đổi state chỉ present vùng buttons
+        dirty_rects = None
+        if is_static and not state_changed and not self._full_redraw:
+            dirty_rects = self._state_dirty_rects()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
+            self._full_redraw = False
+    
+    def _get_game_dirty_rects(self):
+        """Vùng buttons của pause menu (rỗng nếu menu không hiện -> flip toàn màn hình)"""
+        return self.view.get_dirty_rects() if self.view else []
+    
+    def _render_key(self):
+        """Trạng thái đang hiển thị - đổi key nghĩa là cần vẽ lại toàn màn hình"""
+        state = self.app_state
+        if state == AppState.GAME and self.controller:
+            return self.controller.game_state
+        if state == AppState.MENU:
+            return self.menu_manager.current_state
+        return state
+    
+    def _render_menu(self, dt):
+        """Render menu"""
+        self.menu_manager.render(self.screen)
+    
+    def _render_level_select(self, dt):
+        """Render level selection"""
+        self.level_select_view.draw(self.screen)
+    
+    def _render_game(self, dt):
+        """Render game"""
+        if self.view:
+            self.view.draw(dt)
+    
+    def _render_result(self, dt):
+        """Render game result - don't draw game view to prevent flickering"""
+        # Không fill - background cache của result view là surface đục phủ kín screen
+        # Draw result overlay only
+        if self.winner == _PLAYER:
+            all_complete = self.current_level >= 3 and not self.has_next_level
+            self.game_result_view.draw_win_screen(
+                self.screen, self.current_level, self.has_next_level, all_complete
+            )
+        else:
+            self.game_result_view.draw_lose_screen(self.screen, self.current_level)
     
     def _cleanup(self):
         """Clean up resources"""
@@ -567,12 +825,15 @@ class TowerWarGame(Observer):
         
         if self.fullscreen:
             # Native fullscreen resolution
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode((0, 0), FULLSCREEN)
         else:
             # Windowed mode with original resolution
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         pygame.display.set_caption("Tower War")
+        # display.quit() reset event filter của SDL nên cần setup lại
+        self._setup_event_filter()
+        self._full_redraw = True
         
         # Reset scaling values (no longer needed)
         self.scale_x = 1.0
@@ -593,7 +854,10 @@ class TowerWarGame(Observer):
 
 def main():
     """Entry point"""
-        
+    # Log debug của gameplay tắt mặc định - bật bằng `python main.py --debug`
+    logging.basicConfig(level=logging.DEBUG if "--debug" in sys.argv else logging.WARNING,
+                        format="%(name)s: %(message)s")
+    
     try:
         pygame.init()
         icon = pygame.image.load('images/icon.ico')
@@ -609,9 +873,8 @@ def main():
         game.run()
     except KeyboardInterrupt:
         pass
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Unhandled error")
     finally:
         pygame.quit()
         sys.exit()
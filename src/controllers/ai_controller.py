@@ -4,13 +4,26 @@ AI Controller - thể hiện Strategy Pattern và Observer Pattern
 import pygame
 import random
 import math
+import logging
 from abc import ABC, abstractmethod
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 from typing import List, Optional
 from ..models.base import Observer, Subject
 from ..models.tower import Tower, EnemyTower
 from ..models.troop import EnemyTroop
 from ..utils.constants import OwnerType, GameSettings
 
+logger = logging.getLogger(__name__)
+
+# Cache các OwnerType so sánh trong vòng lặp - tránh attribute lookup mỗi tower
+_PLAYER = OwnerType.PLAYER
+_NEUTRAL = OwnerType.NEUTRAL
+_ENEMY = OwnerType.ENEMY
+
+# Key cho các list (tower, value) - chọn top-k bằng heapq thay vì sort cả list
+_BY_VALUE = itemgetter(1)
+
 class AIStrategy(ABC):
     """
     Abstract strategy class cho AI behavior
@@ -29,36 +42,45 @@ class AggressiveStrategy(AIStrategy):
     def decide_action(self, enemy_towers: List[Tower], all_towers: List[Tower]) -> Optional[dict]:
         """Fast aggressive strategy - optimized for level 2 & 3"""
         if not enemy_towers:
-            print("AggressiveStrategy: No enemy towers")
+            logger.debug("AggressiveStrategy: No enemy towers")
             return None
         
-        # Lower requirements for faster actions
-        available_towers = [t for t in enemy_towers if t.troops > 0]
+        # Lower requirements for faster actions - tower mạnh nhất (cho fallback) tìm cùng lượt lọc
+        available_towers = []
+        strongest_tower = None
+        strongest_troops = 0
+        for t in enemy_towers:
+            troops = t.troops
+            if troops > 0:
+                available_towers.append(t)
+                if troops > strongest_troops:
+                    strongest_tower = t
+                    strongest_troops = troops
         if not available_towers:
-            print(f"AggressiveStrategy: No available towers. Enemy towers: {[(t.x, t.y, t.troops) for t in enemy_towers]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AggressiveStrategy: No available towers. Enemy towers: %s", [(t.x, t.y, t.troops) for t in enemy_towers])
             return None
         
         # Find targets (prefer player towers)
-        player_towers = [t for t in all_towers if t.owner == OwnerType.PLAYER]
-        neutral_towers = [t for t in all_towers if t.owner == OwnerType.NEUTRAL]
+        player_towers = [t for t in all_towers if t.owner == _PLAYER]
+        neutral_towers = [t for t in all_towers if t.owner == _NEUTRAL]
         all_targets = player_towers + neutral_towers
         
         if not all_targets:
-            print("AggressiveStrategy: No targets")
+            logger.debug("AggressiveStrategy: No targets")
             return None
         
         # Fast target selection: strongest tower attacks best target
         best_action = self._find_best_attack(available_towers, all_targets)
         
         if best_action:
-            print(f"AggressiveStrategy: Tower at ({best_action['source'].x}, {best_action['source'].y}) with {best_action['source'].troops} troops attacking ({best_action['target'].x}, {best_action['target'].y})")
+            logger.debug("AggressiveStrategy: Tower at (%s, %s) with %s troops attacking (%s, %s)", best_action['source'].x, best_action['source'].y, best_action['source'].troops, best_action['target'].x, best_action['target'].y)
             return best_action
         
         # Fallback: any tower attacks closest target
-        strongest_tower = max(available_towers, key=lambda t: t.troops)
-        closest_target = min(all_targets, key=lambda t: strongest_tower.distance_to(t))
+        closest_target = min(all_targets, key=lambda t: strongest_tower.distance_sq_to(t))
         
-        print(f"AggressiveStrategy: Fallback - Tower at ({strongest_tower.x}, {strongest_tower.y}) attacking ({closest_target.x}, {closest_target.y})")
+        logger.debug("AggressiveStrategy: Fallback - Tower at (%s, %s) attacking (%s, %s)", strongest_tower.x, strongest_tower.y, closest_target.x, closest_target.y)
         
         return {
             'source': strongest_tower,
@@ -77,12 +99,14 @@ class AggressiveStrategy(AIStrategy):
                 
             for target in targets:
                 # Quick scoring system
-                distance = source.distance_to(target)
-                if distance > 400:  # Skip very far targets
+                # So sánh bình phương khoảng cách (400 * 400 được fold lúc compile) - chỉ sqrt khi qua ngưỡng
+                distance_sq = source.distance_sq_to(target)
+                if distance_sq > 400 * 400:  # Skip very far targets
                     continue
+                distance = distance_sq ** 0.5
                 
                 # Priority: player towers > neutral towers
-                target_priority = 2.0 if target.owner == OwnerType.PLAYER else 1.0
+                target_priority = 2.0 if target.owner == _PLAYER else 1.0
                 
                 # Prefer weaker targets
                 troops_advantage = max(0, source.troops - target.troops)
@@ -111,11 +135,11 @@ class AggressiveStrategy(AIStrategy):
             
             # Ưu tiên tower gần nhiều enemy towers (có thể hỗ trợ)
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 200)
+                               if t.distance_sq_to(target) < 200 * 200)
             support_factor = nearby_support * 0.3
             
             # Ưu tiên player towers hơn neutral
-            owner_factor = 2.0 if target.owner == OwnerType.PLAYER else 1.0
+            owner_factor = 2.0 if target.owner == _PLAYER else 1.0
             
             return troops_factor + support_factor + owner_factor
         
@@ -123,15 +147,14 @@ class AggressiveStrategy(AIStrategy):
     
     def _find_coordinated_attackers(self, available_towers: List[Tower], target: Tower) -> List[Tower]:
         """Tìm towers có thể phối hợp tấn công"""
-        # Sắp xếp towers theo khoảng cách đến target
-        towers_by_distance = sorted(available_towers, 
-                                  key=lambda t: t.distance_to(target))
+        # Tối đa 3 towers gần target nhất cùng lúc - chỉ lấy top-k, không sort cả list
+        towers_by_distance = nsmallest(3, available_towers,
+                                       key=lambda t: t.distance_sq_to(target))
         
         coordinated = []
-        max_attackers = min(3, len(towers_by_distance))  # Tối đa 3 towers cùng lúc
         
-        for tower in towers_by_distance[:max_attackers]:
-            if tower.distance_to(target) < 300:  # Trong phạm vi hỗ trợ
+        for tower in towers_by_distance:
+            if tower.distance_sq_to(target) < 300 * 300:  # Trong phạm vi hỗ trợ
                 coordinated.append(tower)
         
         return coordinated if coordinated else [towers_by_distance[0]]
@@ -146,22 +169,27 @@ class DefensiveStrategy(AIStrategy):
         if not enemy_towers:
             return None
         
-        # Simple requirement
-        available_towers = [t for t in enemy_towers if t.troops > 1]
-        if not available_towers:
+        # Simple requirement - lọc towers đủ quân và tìm tower mạnh nhất trong cùng 1 lượt
+        source = None
+        source_troops = 1
+        for t in enemy_towers:
+            troops = t.troops
+            if troops > source_troops:
+                source = t
+                source_troops = troops
+        if source is None:
             return None
         
         # Find targets (prefer neutral)
-        neutral_towers = [t for t in all_towers if t.owner == OwnerType.NEUTRAL]
-        player_towers = [t for t in all_towers if t.owner == OwnerType.PLAYER]
+        neutral_towers = [t for t in all_towers if t.owner == _NEUTRAL]
+        player_towers = [t for t in all_towers if t.owner == _PLAYER]
         targets = neutral_towers if neutral_towers else player_towers
         
         if not targets:
             return None
         
         # Simple action
-        source = max(available_towers, key=lambda t: t.troops)
-        target = min(targets, key=lambda t: source.distance_to(t))
+        target = min(targets, key=lambda t: source.distance_sq_to(t))
         
         return {
             'source': source,
@@ -177,7 +205,7 @@ class DefensiveStrategy(AIStrategy):
             
             # Ưu tiên tower gần nhiều enemy towers (dễ hỗ trợ)
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 250)
+                               if t.distance_sq_to(target) < 250 * 250)
             support_factor = nearby_support * 0.4
             
             # Ưu tiên tower ở vị trí trung tâm
@@ -196,7 +224,7 @@ class DefensiveStrategy(AIStrategy):
             
             # Ưu tiên tower có nhiều enemy towers gần (có thể hỗ trợ)
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 200)
+                               if t.distance_sq_to(target) < 200 * 200)
             support_factor = nearby_support * 0.5
             
             return troops_factor + support_factor
@@ -208,28 +236,26 @@ class DefensiveStrategy(AIStrategy):
         towers_by_value = []
         
         for tower in available_towers:
-            distance = tower.distance_to(target)
-            if distance < 280:  # Trong phạm vi expansion
+            distance_sq = tower.distance_sq_to(target)
+            if distance_sq < 280 * 280:  # Trong phạm vi expansion
+                distance = distance_sq ** 0.5
                 # Tính giá trị của tower này cho expansion
                 value = tower.troops * 0.3 + (1.0 / max(distance, 1)) * 100
                 towers_by_value.append((tower, value))
         
-        # Sắp xếp theo giá trị và chọn tối đa 2 towers
-        towers_by_value.sort(key=lambda x: x[1], reverse=True)
-        max_expanders = min(2, len(towers_by_value))
-        
-        return [tower for tower, _ in towers_by_value[:max_expanders]]
+        # Chọn tối đa 2 towers giá trị cao nhất
+        return [tower for tower, _ in nlargest(2, towers_by_value, key=_BY_VALUE)]
     
     def _find_coordinated_attackers(self, available_towers: List[Tower], target: Tower) -> List[Tower]:
         """Tìm towers để coordinated attack (defensive)"""
-        towers_by_distance = sorted(available_towers, 
-                                  key=lambda t: t.distance_to(target))
+        # Conservative approach - tối đa 2 towers gần nhất
+        towers_by_distance = nsmallest(2, available_towers,
+                                       key=lambda t: t.distance_sq_to(target))
         
         coordinated = []
-        max_attackers = min(2, len(towers_by_distance))  # Conservative approach
         
-        for tower in towers_by_distance[:max_attackers]:
-            if tower.distance_to(target) < 250:
+        for tower in towers_by_distance:
+            if tower.distance_sq_to(target) < 250 * 250:
                 coordinated.append(tower)
         
         return coordinated if coordinated else [towers_by_distance[0]]
@@ -249,27 +275,46 @@ class SmartStrategy(AIStrategy):
     def decide_action(self, enemy_towers: List[Tower], all_towers: List[Tower]) -> Optional[dict]:
         """Smart strategy với advanced multi-tower tactics"""
         if not enemy_towers:
-            print("SmartStrategy: No enemy towers available")
+            logger.debug("SmartStrategy: No enemy towers available")
             return None
         
-        available_towers = [t for t in enemy_towers if t.troops > 0]  # Chỉ cần > 0 thay vì > 1
-        print(f"SmartStrategy: {len(available_towers)} available towers from {len(enemy_towers)} enemy towers")
+        # 1 lượt qua enemy towers: towers gửi được quân + tổng quân AI
+        available_towers = []  # Chỉ cần > 0 thay vì > 1
+        strong_count = 0  # Số towers > 1 quân (đủ để phối hợp)
+        enemy_strength = 0
+        for t in enemy_towers:
+            troops = t.troops
+            enemy_strength += troops
+            if troops > 0:
+                available_towers.append(t)
+                if troops > 1:
+                    strong_count += 1
+        logger.debug("SmartStrategy: %s available towers from %s enemy towers", len(available_towers), len(enemy_towers))
         
         if not available_towers:
-            print("SmartStrategy: No available towers with enough troops")
+            logger.debug("SmartStrategy: No available towers with enough troops")
             return None
         
-        player_towers = [t for t in all_towers if t.owner == OwnerType.PLAYER]
-        neutral_towers = [t for t in all_towers if t.owner == OwnerType.NEUTRAL]
+        # 1 lượt qua all towers: chia targets theo owner + tổng quân player
+        player_towers = []
+        neutral_towers = []
+        player_strength = 0
+        for t in all_towers:
+            owner = t.owner
+            if owner == _PLAYER:
+                player_towers.append(t)
+                player_strength += t.troops
+            elif owner == _NEUTRAL:
+                neutral_towers.append(t)
         
-        print(f"SmartStrategy: Targets - {len(player_towers)} player, {len(neutral_towers)} neutral")
+        logger.debug("SmartStrategy: Targets - %s player, %s neutral", len(player_towers), len(neutral_towers))
         
         # Adaptive tactical mode switching
-        self._update_tactical_mode(enemy_towers, player_towers, neutral_towers)
+        self._update_tactical_mode(enemy_strength, player_strength)
         
         # Đánh giá tình hình và chọn action type
-        action_type = self._analyze_situation(enemy_towers, player_towers, neutral_towers)
-        print(f"SmartStrategy: Chosen action type: {action_type}")
+        action_type = self._analyze_situation(strong_count, neutral_towers)
+        logger.debug("SmartStrategy: Chosen action type: %s", action_type)
         
         if action_type == "coordinated_assault":
             # Coordinated assault can target both player and neutral towers
@@ -282,19 +327,16 @@ class SmartStrategy(AIStrategy):
         else:
             result = self._opportunistic_strike(available_towers, player_towers + neutral_towers)
         
-        print(f"SmartStrategy: Action result: {result is not None}")
+        logger.debug("SmartStrategy: Action result: %s", result is not None)
         return result
     
-    def _update_tactical_mode(self, enemy_towers: List[Tower], player_towers: List[Tower], neutral_towers: List[Tower]):
-        """Cập nhật chế độ chiến thuật dựa trên tình hình"""
+    def _update_tactical_mode(self, enemy_strength: int, player_strength: int):
+        """Cập nhật chế độ chiến thuật dựa trên tổng quân hai bên"""
         current_time = pygame.time.get_ticks()
         
         if current_time < self.mode_change_cooldown:
             return
         
-        enemy_strength = sum(t.troops for t in enemy_towers)
-        player_strength = sum(t.troops for t in player_towers)
-        
         # Chế độ aggressive khi AI mạnh hơn nhiều
         if enemy_strength > player_strength * 1.5:
             self.tactical_mode = "aggressive"
@@ -307,12 +349,10 @@ class SmartStrategy(AIStrategy):
         # Cooldown để tránh đổi mode quá thường xuyên
         self.mode_change_cooldown = current_time + 5000  # 5 seconds
     
-    def _analyze_situation(self, enemy_towers: List[Tower], player_towers: List[Tower], neutral_towers: List[Tower]) -> str:
+    def _analyze_situation(self, strong_count: int, neutral_towers: List[Tower]) -> str:
         """Phân tích tình hình để quyết định action type - Simple logic for all levels"""
-        available_towers = [t for t in enemy_towers if t.troops > 1]
-        
         # Simple random selection between coordination and single attacks
-        if len(available_towers) >= 2 and random.random() > 0.7:  # 30% chance for multi-tower
+        if strong_count >= 2 and random.random() > 0.7:  # 30% chance for multi-tower
             return "coordinated_assault"
         elif neutral_towers and random.random() > 0.5:
             return "strategic_expansion"
@@ -322,21 +362,21 @@ class SmartStrategy(AIStrategy):
     def _coordinated_assault(self, available_towers: List[Tower], targets: List[Tower]) -> Optional[dict]:
         """Tấn công phối hợp với nhiều towers - Enhanced to target any available targets"""
         if not targets:
-            print("_coordinated_assault: No targets available")
+            logger.debug("_coordinated_assault: No targets available")
             return None
         
-        print(f"_coordinated_assault: {len(available_towers)} available towers, {len(targets)} targets")
+        logger.debug("_coordinated_assault: %s available towers, %s targets", len(available_towers), len(targets))
         
         # Chọn target có giá trị cao nhất
         priority_target = self._select_assault_target(targets, available_towers)
-        print(f"_coordinated_assault: Selected target at ({priority_target.x}, {priority_target.y}) with {priority_target.troops} troops, owner={priority_target.owner}")
+        logger.debug("_coordinated_assault: Selected target at (%s, %s) with %s troops, owner=%s", priority_target.x, priority_target.y, priority_target.troops, priority_target.owner)
         
         # Tìm towers có thể tham gia assault
         assault_force = self._assemble_assault_force(available_towers, priority_target)
-        print(f"_coordinated_assault: Assembled force of {len(assault_force)} towers")
+        logger.debug("_coordinated_assault: Assembled force of %s towers", len(assault_force))
         
         if not assault_force:
-            print("_coordinated_assault: No assault force assembled")
+            logger.debug("_coordinated_assault: No assault force assembled")
             return None
         
         return {
@@ -348,21 +388,21 @@ class SmartStrategy(AIStrategy):
     def _strategic_expansion(self, available_towers: List[Tower], neutral_targets: List[Tower]) -> Optional[dict]:
         """Mở rộng chiến lược với coordination - Enhanced to ensure multi-tower"""
         if not neutral_targets:
-            print("_strategic_expansion: No neutral targets")
+            logger.debug("_strategic_expansion: No neutral targets")
             return None
         
-        print(f"_strategic_expansion: {len(available_towers)} available towers, {len(neutral_targets)} neutral targets")
+        logger.debug("_strategic_expansion: %s available towers, %s neutral targets", len(available_towers), len(neutral_targets))
         
         # Chọn neutral tower tốt nhất để expansion
         expansion_target = self._select_expansion_target(neutral_targets, available_towers)
-        print(f"_strategic_expansion: Selected target at ({expansion_target.x}, {expansion_target.y}) with {expansion_target.troops} troops")
+        logger.debug("_strategic_expansion: Selected target at (%s, %s) with %s troops", expansion_target.x, expansion_target.y, expansion_target.troops)
         
         # Tìm towers để support expansion
         expansion_force = self._assemble_expansion_force(available_towers, expansion_target)
-        print(f"_strategic_expansion: Assembled force of {len(expansion_force)} towers")
+        logger.debug("_strategic_expansion: Assembled force of %s towers", len(expansion_force))
         
         if not expansion_force:
-            print("_strategic_expansion: No expansion force assembled")
+            logger.debug("_strategic_expansion: No expansion force assembled")
             return None
         
         return {
@@ -393,36 +433,36 @@ class SmartStrategy(AIStrategy):
     def _opportunistic_strike(self, available_towers: List[Tower], targets: List[Tower]) -> Optional[dict]:
         """Strike cơ hội với single attack - always return an action"""
         if not targets or not available_towers:
-            print("_opportunistic_strike: No targets or available towers")
+            logger.debug("_opportunistic_strike: No targets or available towers")
             return None
         
-        print(f"_opportunistic_strike: {len(available_towers)} towers, {len(targets)} targets")
+        logger.debug("_opportunistic_strike: %s towers, %s targets", len(available_towers), len(targets))
         
         # Always try to find a viable action - lower requirements
         for source_tower in available_towers:
             if source_tower.troops > 0:  # Chỉ cần > 0 thay vì > 1
                 # Find closest target
-                closest_target = min(targets, key=lambda t: source_tower.distance_to(t))
+                closest_target = min(targets, key=lambda t: source_tower.distance_sq_to(t))
                 
-                print(f"_opportunistic_strike: Found action - {source_tower.troops} troops attacking")
+                logger.debug("_opportunistic_strike: Found action - %s troops attacking", source_tower.troops)
                 return {
                     'source': source_tower,
                     'target': closest_target,
                     'type': 'single_attack'
                 }
         
-        print("_opportunistic_strike: No viable action found")
+        logger.debug("_opportunistic_strike: No viable action found")
         return None
     
     def _select_assault_target(self, targets: List[Tower], available_towers: List[Tower]) -> Tower:
         """Chọn target cho coordinated assault"""
         def assault_priority(target):
             # Ưu tiên player towers
-            owner_bonus = 3.0 if target.owner == OwnerType.PLAYER else 1.0
+            owner_bonus = 3.0 if target.owner == _PLAYER else 1.0
             
             # Ưu tiên targets có nhiều support nearby
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 250 and t.troops > 5)
+                               if t.distance_sq_to(target) < 250 * 250 and t.troops > 5)
             support_factor = nearby_support * 0.6
             
             # Factor in troop count (prefer weaker targets)
@@ -440,21 +480,20 @@ class SmartStrategy(AIStrategy):
         max_distance = 300
         max_attackers_count = 2
         
+        max_distance_sq = max_distance * max_distance
         for tower in available_towers:
-            distance = tower.distance_to(target)
-            if distance < max_distance and tower.troops > 1:
+            distance_sq = tower.distance_sq_to(target)
+            if distance_sq < max_distance_sq and tower.troops > 1:
+                distance = distance_sq ** 0.5
                 # Simple priority calculation
                 priority = tower.troops + (200 / max(distance, 1))
                 potential_attackers.append((tower, priority))
         
-        # Sort and select best attackers
-        potential_attackers.sort(key=lambda x: x[1], reverse=True)
-        selected_count = min(max_attackers_count, len(potential_attackers))
-        
         if not potential_attackers and available_towers:
             return [available_towers[0]]
         
-        return [tower for tower, _ in potential_attackers[:selected_count]]
+        # Select best attackers
+        return [tower for tower, _ in nlargest(max_attackers_count, potential_attackers, key=_BY_VALUE)]
     
     def _select_expansion_target(self, neutral_targets: List[Tower], available_towers: List[Tower]) -> Tower:
         """Chọn target cho expansion"""
@@ -468,7 +507,7 @@ class SmartStrategy(AIStrategy):
             
             # Support availability
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 280)
+                               if t.distance_sq_to(target) < 280 * 280)
             support_factor = nearby_support * 0.3
             
             return ease_factor + position_factor + support_factor
@@ -490,11 +529,13 @@ class SmartStrategy(AIStrategy):
             max_distance = 400  # Maximum range
             max_expanders_count = 4  # Maximum coordination
         
-        print(f"_assemble_expansion_force: {len(available_towers)} available towers, target at ({target.x}, {target.y})")
+        logger.debug("_assemble_expansion_force: %s available towers, target at (%s, %s)", len(available_towers), target.x, target.y)
         
+        max_distance_sq = max_distance * max_distance
         for tower in available_towers:
-            distance = tower.distance_to(target)
-            if distance < max_distance and tower.troops > 0:
+            distance_sq = tower.distance_sq_to(target)
+            if distance_sq < max_distance_sq and tower.troops > 0:
+                distance = distance_sq ** 0.5
                 # Enhanced value calculation
                 troops_value = tower.troops * 0.4
                 distance_value = (1.0 / max(distance, 1)) * 100
@@ -503,14 +544,13 @@ class SmartStrategy(AIStrategy):
                 
                 value = troops_value + distance_value + difficulty_bonus
                 expanders.append((tower, value))
-                print(f"  Added tower at ({tower.x}, {tower.y}) with {tower.troops} troops, distance={distance:.1f}, value={value:.1f}")
+                logger.debug("  Added tower at (%s, %s) with %s troops, distance=%.1f, value=%.1f", tower.x, tower.y, tower.troops, distance, value)
         
-        expanders.sort(key=lambda x: x[1], reverse=True)
         selected_count = min(max_expanders_count, len(expanders))
         
         # Ensure at least 1 tower if available
         if not expanders and available_towers:
-            print("_assemble_expansion_force: No expanders, using fallback")
+            logger.debug("_assemble_expansion_force: No expanders, using fallback")
             return [available_towers[0]]
         
         # For medium/hard, prefer multiple towers for expansion
@@ -521,14 +561,14 @@ class SmartStrategy(AIStrategy):
         selected_towers = []
         seen_positions = set()
         
-        for tower, _ in expanders[:selected_count]:
+        for tower, _ in nlargest(selected_count, expanders, key=_BY_VALUE):
             tower_pos = (tower.x, tower.y)
             if tower_pos not in seen_positions:
                 selected_towers.append(tower)
                 seen_positions.add(tower_pos)
-                print(f"  Selected tower at ({tower.x}, {tower.y}) with {tower.troops} troops for expansion")
+                logger.debug("  Selected tower at (%s, %s) with %s troops for expansion", tower.x, tower.y, tower.troops)
         
-        print(f"_assemble_expansion_force: Selected {len(selected_towers)} unique towers for expansion")
+        logger.debug("_assemble_expansion_force: Selected %s unique towers for expansion", len(selected_towers))
         return selected_towers
     
     def _select_safe_target(self, targets: List[Tower], available_towers: List[Tower]) -> Tower:
@@ -539,7 +579,7 @@ class SmartStrategy(AIStrategy):
             
             # Ưu tiên targets có support gần
             nearby_support = sum(1 for t in available_towers 
-                               if t.distance_to(target) < 200)
+                               if t.distance_sq_to(target) < 200 * 200)
             support_factor = nearby_support * 0.4
             
             return weakness_factor + support_factor
@@ -562,18 +602,16 @@ class SmartStrategy(AIStrategy):
             max_conservative_count = 3  # Allow up to 3 towers
         
         # Collect potential conservative attackers
+        max_distance_sq = max_distance * max_distance
         for tower in available_towers:
-            distance = tower.distance_to(target)
-            if distance < max_distance and tower.troops > 0:
+            distance_sq = tower.distance_sq_to(target)
+            if distance_sq < max_distance_sq and tower.troops > 0:
+                distance = distance_sq ** 0.5
                 conservative.append((tower, tower.troops + (1.0 / max(distance, 1)) * 50))
         
-        # Sort by value and select best ones
-        conservative.sort(key=lambda x: x[1], reverse=True)
-        selected_count = min(max_conservative_count, len(conservative))
-        
-        # Return selected towers
+        # Return best ones by value
         if conservative:
-            return [tower for tower, _ in conservative[:selected_count]]
+            return [tower for tower, _ in nlargest(max_conservative_count, conservative, key=_BY_VALUE)]
         elif available_towers:
             # Fallback: at least 1 tower
             return available_towers[:1]
@@ -590,9 +628,10 @@ class SmartStrategy(AIStrategy):
                 continue
                 
             for target in targets:
-                distance = source.distance_to(target)
-                if distance > 300:
+                distance_sq = source.distance_sq_to(target)
+                if distance_sq > 300 * 300:
                     continue
+                distance = distance_sq ** 0.5
                 
                 # Tính opportunity score
                 troops_advantage = source.troops - target.troops
@@ -619,7 +658,7 @@ class SmartStrategy(AIStrategy):
         # Nếu không có neutral, tấn công player tower yếu nhất
         if player_targets:
             weak_target = min(player_targets, key=lambda t: t.troops)
-            source = min(sources, key=lambda t: t.distance_to(weak_target))
+            source = min(sources, key=lambda t: t.distance_sq_to(weak_target))
             return {'source': source, 'target': weak_target}
         
         return None
@@ -632,7 +671,7 @@ class SmartStrategy(AIStrategy):
             return None
         
         # Random choice giữa aggressive và defensive
-        if random.choice([True, False]):
+        if random.getrandbits(1):
             return self._aggressive_action(sources, all_targets)
         else:
             return self._defensive_action(sources, neutral_targets, player_targets)
@@ -642,6 +681,33 @@ class AIController(Observer, Subject):
     AI Controller class - thể hiện Observer Pattern và Strategy Pattern
     """
     
+    # Factory theo difficulty - chỉ tạo strategy được chọn (SmartStrategy for all levels with different intensities)
+    _STRATEGY_FACTORIES = {
+        'easy': SmartStrategy,                              # Level 1 - Normal smart strategy
+        'medium': SmartStrategy,                            # Level 2 - Enhanced smart strategy
+        'hard': SmartStrategy,                              # Level 3 - Advanced smart strategy
+        'nightmare': lambda difficulty: AggressiveStrategy()  # Keep nightmare for special cases
+    }
+    
+    # Adjust action interval and aggressiveness based on difficulty - Rollback to original simple settings
+    _DIFFICULTY_SETTINGS = {
+        'easy': {
+            'interval': 1500,     # 1.5 seconds for all levels
+            'min_troops': 2,      # Simple requirements  
+            'coordination': 0.2   # Low coordination
+        },
+        'medium': {
+            'interval': 1500,     # Same as level 1
+            'min_troops': 2,      # Same requirements
+            'coordination': 0.2   # Same coordination
+        },
+        'hard': {
+            'interval': 1500,     # Same as level 1  
+            'min_troops': 2,      # Same requirements
+            'coordination': 0.2   # Same coordination
+        }
+    }
+    
     def __init__(self, difficulty: str = 'medium'):
         Observer.__init__(self)
         Subject.__init__(self)
@@ -656,16 +722,16 @@ class AIController(Observer, Subject):
         self.actions_taken = 0
         self.successful_attacks = 0
         self.failed_attacks = 0
+        
+        # Game events AI cần xử lý - các event khác bỏ qua
+        self._observer_dispatch = {
+            "tower_captured": self._on_tower_captured,
+            "game_started": self._on_game_started,
+        }
     
     def _create_strategy(self, difficulty: str) -> AIStrategy:
         """Factory method để tạo AI strategy - SmartStrategy for all levels with different intensities"""
-        strategies = {
-            'easy': SmartStrategy(difficulty),      # Level 1 - Normal smart strategy
-            'medium': SmartStrategy(difficulty),    # Level 2 - Enhanced smart strategy  
-            'hard': SmartStrategy(difficulty),      # Level 3 - Advanced smart strategy
-            'nightmare': AggressiveStrategy()       # Keep nightmare for special cases
-        }
-        return strategies.get(difficulty, SmartStrategy(difficulty))
+        return self._STRATEGY_FACTORIES.get(difficulty, SmartStrategy)(difficulty)
     
     def set_difficulty(self, difficulty: str):
         """Thay đổi độ khó AI với advanced settings"""
@@ -676,25 +742,7 @@ class AIController(Observer, Subject):
         if hasattr(self.strategy, 'difficulty'):
             self.strategy.difficulty = difficulty
         
-        # Adjust action interval and aggressiveness based on difficulty - Rollback to original simple settings
-        difficulty_settings = {
-            'easy': {
-                'interval': 1500,     # 1.5 seconds for all levels
-                'min_troops': 2,      # Simple requirements  
-                'coordination': 0.2   # Low coordination
-            },
-            'medium': {
-                'interval': 1500,     # Same as level 1
-                'min_troops': 2,      # Same requirements
-                'coordination': 0.2   # Same coordination
-            },
-            'hard': {
-                'interval': 1500,     # Same as level 1  
-                'min_troops': 2,      # Same requirements
-                'coordination': 0.2   # Same coordination
-            }
-        }
-        
+        difficulty_settings = self._DIFFICULTY_SETTINGS
         settings = difficulty_settings.get(difficulty, difficulty_settings['medium'])
         self.action_interval = settings['interval']
         self.min_troops_threshold = settings['min_troops']
@@ -705,18 +753,25 @@ class AIController(Observer, Subject):
         Implementation của Observer interface
         Respond to game events
         """
-        if event_type == "tower_captured":
-            if data.get("new_owner") == OwnerType.ENEMY:
-                self.successful_attacks += 1
-            elif data.get("old_owner") == OwnerType.ENEMY:
-                self.failed_attacks += 1
-        
-        elif event_type == "game_started":
-            self.reset_stats()
-    
-    def should_take_action(self) -> bool:
-        """Kiểm tra xem AI có nên hành động không"""
-        current_time = pygame.time.get_ticks()
+        handler = self._observer_dispatch.get(event_type)
+        if handler:
+            handler(data)
+    
+    def _on_tower_captured(self, data: dict):
+        """Game event: tower đổi chủ - cập nhật thống kê tấn công"""
+        if data.get("new_owner") == _ENEMY:
+            self.successful_attacks += 1
+        elif data.get("old_owner") == _ENEMY:
+            self.failed_attacks += 1
+    
+    def _on_game_started(self, data: dict):
+        """Game event: bắt đầu game mới"""
+        self.reset_stats()
+    
+    def should_take_action(self, current_time: Optional[int] = None) -> bool:
+        """Kiểm tra xem AI có nên hành động không (current_time: ticks caller đã lấy sẵn)"""
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         return current_time - self.last_action_time >= self.action_interval
     
     def execute_action(self, towers: List[Tower]) -> Optional[dict]:
@@ -724,18 +779,18 @@ class AIController(Observer, Subject):
         Thực hiện hành động AI với multi-tower coordination
         Returns: dict với action info nếu có action được thực hiện
         """
+        # Lấy ticks 1 lần - dùng cho cả kiểm tra cooldown lẫn last_action_time
         current_time = pygame.time.get_ticks()
-        should_act = self.should_take_action()
-        print(f"AI execute_action: should_act={should_act}, last_action={self.last_action_time}, current={current_time}, interval={self.action_interval}")
-        
-        if not should_act:
+        # Gọi mỗi frame nhưng phần lớn đang cooldown - thoát trước mọi việc khác (kể cả log)
+        if not self.should_take_action(current_time):
             return None
+        logger.debug("AI execute_action: last_action=%s, current=%s, interval=%s", self.last_action_time, current_time, self.action_interval)
         
-        enemy_towers = [t for t in towers if t.owner == OwnerType.ENEMY]
-        print(f"AI execute_action: {len(enemy_towers)} enemy towers total")
+        enemy_towers = [t for t in towers if t.owner == _ENEMY]
+        logger.debug("AI execute_action: %s enemy towers total", len(enemy_towers))
         
         if not enemy_towers:
-            print("AI execute_action: No enemy towers found")
+            logger.debug("AI execute_action: No enemy towers found")
             return None
         
         # Sử dụng strategy để quyết định action
@@ -743,25 +798,25 @@ class AIController(Observer, Subject):
         
         # Debug: check if AI has action
         if not action:
-            print(f"AI No Action: {len(enemy_towers)} enemy towers available")
+            logger.debug("AI No Action: %s enemy towers available", len(enemy_towers))
             # Fallback: force một action đơn giản nếu có towers
             if enemy_towers:
-                print(f"AI Fallback: Trying to create fallback action")
-                all_targets = [t for t in towers if t.owner != OwnerType.ENEMY]
-                print(f"AI Fallback: Found {len(all_targets)} targets")
+                logger.debug("AI Fallback: Trying to create fallback action")
+                all_targets = [t for t in towers if t.owner != _ENEMY]
+                logger.debug("AI Fallback: Found %s targets", len(all_targets))
                 if all_targets and enemy_towers[0].troops > 0:
-                    print(f"AI Fallback: Creating action with tower troops={enemy_towers[0].troops}")
+                    logger.debug("AI Fallback: Creating action with tower troops=%s", enemy_towers[0].troops)
                     action = {
                         'source': enemy_towers[0],
                         'target': all_targets[0],
                         'type': 'single_attack'
                     }
-                    print(f"AI Fallback action created successfully")
+                    logger.debug("AI Fallback action created successfully")
         
         if not action:
             return None
         
-        print(f"AI Action type: {action.get('type', 'unknown')}")  # Debug
+        logger.debug("AI Action type: %s", action.get('type', 'unknown'))  # Debug
         
         if action:
             # Handle both single and multi-tower actions
@@ -773,24 +828,25 @@ class AIController(Observer, Subject):
                 successful_attacks = []
                 total_troops = 0
                 
-                print(f"AI Multi-action debug: sources={len(sources)}, target exists={target is not None}")
-                print(f"AI Multi-action: Target at ({target.x}, {target.y}) with {target.troops} troops")
+                logger.debug("AI Multi-action debug: sources=%s, target exists=%s", len(sources), target is not None)
+                logger.debug("AI Multi-action: Target at (%s, %s) with %s troops", target.x, target.y, target.troops)
                 
                 # Debug: Check for duplicate towers
                 source_positions = [(tower.x, tower.y) for tower in sources]
                 unique_positions = set(source_positions)
-                print(f"AI Multi-action: {len(sources)} source towers, {len(unique_positions)} unique positions")
+                logger.debug("AI Multi-action: %s source towers, %s unique positions", len(sources), len(unique_positions))
                 if len(sources) != len(unique_positions):
-                    print("WARNING: Duplicate towers detected in sources!")
+                    logger.warning("Duplicate towers detected in sources!")
                 
-                for i, source_tower in enumerate(sources):
-                    print(f"  Source {i}: Tower at ({source_tower.x}, {source_tower.y}) with {source_tower.troops} troops, can_send={source_tower.can_send_troops()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, source_tower in enumerate(sources):
+                        logger.debug("  Source %s: Tower at (%s, %s) with %s troops, can_send=%s", i, source_tower.x, source_tower.y, source_tower.troops, source_tower.can_send_troops())
                 
                 for i, source_tower in enumerate(sources):
                     if source_tower.can_send_troops():
-                        print(f"AI Multi-action {i}: Sending troops from tower at ({source_tower.x}, {source_tower.y}) with {source_tower.troops} troops")
+                        logger.debug("AI Multi-action %s: Sending troops from tower at (%s, %s) with %s troops", i, source_tower.x, source_tower.y, source_tower.troops)
                         troops_count = source_tower.send_troops(target)
-                        print(f"AI Multi-action {i}: Sent {troops_count} troops")
+                        logger.debug("AI Multi-action %s: Sent %s troops", i, troops_count)
                         if troops_count > 0:
                             successful_attacks.append({
                                 'source': source_tower,
@@ -799,11 +855,11 @@ class AIController(Observer, Subject):
                             })
                             total_troops += troops_count
                     else:
-                        print(f"AI Multi-action {i}: Tower at ({source_tower.x}, {source_tower.y}) cannot send troops")
+                        logger.debug("AI Multi-action %s: Tower at (%s, %s) cannot send troops", i, source_tower.x, source_tower.y)
                 
                 if successful_attacks:
                     self.actions_taken += 1
-                    self.last_action_time = pygame.time.get_ticks()
+                    self.last_action_time = current_time
                     
                     # Không thêm stagger delay để AI có thể hành động liên tục
                     # base_delay = random.randint(200, 500)
@@ -822,20 +878,21 @@ class AIController(Observer, Subject):
                 source_tower = action.get('source')
                 target_tower = action.get('target')
                 
-                print(f"AI single action: source troops={source_tower.troops if source_tower else 'None'}, can_send={source_tower.can_send_troops() if source_tower else 'None'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("AI single action: source troops=%s, can_send=%s", source_tower.troops if source_tower else 'None', source_tower.can_send_troops() if source_tower else 'None')
                 
                 if source_tower and target_tower:
-                    print(f"AI debug: source_tower exists, target_tower exists")
-                    print(f"AI debug: source troops={source_tower.troops}, owner={source_tower.owner}")
+                    logger.debug("AI debug: source_tower exists, target_tower exists")
+                    logger.debug("AI debug: source troops=%s, owner=%s", source_tower.troops, source_tower.owner)
                     
                     if source_tower.can_send_troops():
-                        print(f"AI debug: can_send_troops=True, calling send_troops()")
+                        logger.debug("AI debug: can_send_troops=True, calling send_troops()")
                         troops_count = source_tower.send_troops(target_tower)
-                        print(f"AI sent {troops_count} troops from tower")
+                        logger.debug("AI sent %s troops from tower", troops_count)
                         
                         if troops_count > 0:
                             self.actions_taken += 1
-                            self.last_action_time = pygame.time.get_ticks()
+                            self.last_action_time = current_time
                             
                             # Không thêm additional_delay để AI có thể hành động liên tục
                             # additional_delay = random.randint(300, 900)
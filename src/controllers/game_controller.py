@@ -5,6 +5,7 @@ Thể hiện Singleton Pattern, Observer Pattern, và State Pattern
 import pygame
 import random
 import math
+import logging
 from typing import List, Optional, Tuple
 from ..models.base import Observer, Subject
 from ..models.tower import Tower, PlayerTower, EnemyTower
@@ -13,6 +14,9 @@ from ..controllers.ai_controller import AIController
 from ..controllers.level_manager import LevelManager
 from ..utils.constants import OwnerType, GameState, GameSettings
 from ..utils.progression_manager import ProgressionManager
+from ..utils.sound_manager import SoundManager
+
+logger = logging.getLogger(__name__)
 
 class GameController(Subject, Observer):
     """
@@ -49,6 +53,9 @@ class GameController(Subject, Observer):
         # Progression manager for auto-save
         self._progression_manager = ProgressionManager()
         
+        # Sound effects - SoundManager là singleton, giữ 1 reference thay vì gọi lại mỗi lần capture
+        self._sound_manager = SoundManager()
+        
         # Controllers
         self._ai_controller = AIController('medium')
         self._ai_controller.attach(self)  # Observer pattern
@@ -58,6 +65,9 @@ class GameController(Subject, Observer):
         self._player_actions = 0
         self._total_battles = 0
         
+        # Số tower theo owner - cập nhật khi owner_changed thay vì đếm lại mỗi frame
+        self._tower_counts = {OwnerType.PLAYER: 0, OwnerType.ENEMY: 0, OwnerType.NEUTRAL: 0}
+        
         # Auto-save timer
         self._last_auto_save = pygame.time.get_ticks()
         self._auto_save_interval = 10000  # Auto-save every 10 seconds
@@ -74,8 +84,12 @@ class GameController(Subject, Observer):
     
     def _setup_observers(self):
         """Setup observer relationships"""
+        counts = self._tower_counts
+        for owner in counts:
+            counts[owner] = 0
         for tower in self._towers:
             tower.attach(self)  # Game controller observes all towers
+            counts[tower.owner] += 1
     
     def _create_initial_towers(self):
         """Tạo towers ban đầu theo design pattern với vị trí động"""
@@ -93,7 +107,6 @@ class GameController(Subject, Observer):
             self._towers.append(tower)
         
         # Neutral towers (scattered between)
-        import random
         for x, y in positions['neutral']:
             troops = random.randint(5, 15)
             tower = Tower(x, y, OwnerType.NEUTRAL, troops)
@@ -280,6 +293,8 @@ class GameController(Subject, Observer):
             self._handle_troops_sent(data)
         
         elif event_type == "owner_changed":
+            self._tower_counts[data['old_owner']] -= 1
+            self._tower_counts[data['new_owner']] += 1
             self._handle_tower_captured(data)
             self._check_win_condition()
         
@@ -324,21 +339,21 @@ class GameController(Subject, Observer):
         if tower not in self._selected_towers:
             self._selected_towers.append(tower)
             tower.selected = True
-            print(f"Selected tower at ({tower.x}, {tower.y}). Total selected: {len(self._selected_towers)}")
+            logger.debug("Selected tower at (%s, %s). Total selected: %s", tower.x, tower.y, len(self._selected_towers))
     
     def _deselect_tower(self, tower: Tower):
         """Bỏ chọn một tower cụ thể"""
         if tower in self._selected_towers:
             self._selected_towers.remove(tower)
             tower.selected = False
-            print(f"Deselected tower at ({tower.x}, {tower.y}). Total selected: {len(self._selected_towers)}")
+            logger.debug("Deselected tower at (%s, %s). Total selected: %s", tower.x, tower.y, len(self._selected_towers))
     
     def _deselect_all_towers(self):
         """Bỏ chọn tất cả towers"""
         for tower in self._selected_towers:
             tower.selected = False
         self._selected_towers.clear()
-        print("Deselected all towers")
+        logger.debug("Deselected all towers")
     
     def _send_troops_from_selected(self, target: Tower):
         """Gửi quân từ tất cả towers được chọn đến target tower với staggered timing"""
@@ -363,7 +378,7 @@ class GameController(Subject, Observer):
                         "multi_tower_attack"  # Action type để có spacing phù hợp
                     )
                     total_troops_sent += troops_count
-                    print(f"Sending {troops_count} troops from ({source_tower.x}, {source_tower.y}) to ({target.x}, {target.y}) with {tower_delay}ms delay")
+                    logger.debug("Sending %s troops from (%s, %s) to (%s, %s) with %sms delay", troops_count, source_tower.x, source_tower.y, target.x, target.y, tower_delay)
         
         if total_troops_sent > 0:
             # Notify observers về troops creation
@@ -372,7 +387,7 @@ class GameController(Subject, Observer):
                 "sources": self._selected_towers,
                 "target": target
             })
-            print(f"Total troops sent: {total_troops_sent} from {len(self._selected_towers)} towers")
+            logger.debug("Total troops sent: %s from %s towers", total_troops_sent, len(self._selected_towers))
     
     def _send_troops(self, source: Tower, target: Tower):
         """Legacy method - gửi quân từ source đến target (giữ lại để backward compatibility)"""
@@ -549,9 +564,7 @@ class GameController(Subject, Observer):
         new_owner = data['new_owner']
         
         # Play tower capture sound effect với volume thấp hơn để không đè lên các sound khác
-        from ..utils.sound_manager import SoundManager
-        sound_manager = SoundManager()
-        sound_manager.play("tower_destroy", volume=0.6)  # Giảm từ 0.8 xuống 0.6
+        self._sound_manager.play("tower_destroy", volume=0.6)  # Giảm từ 0.8 xuống 0.6
         
         # Notify observers about tower capture
         self.notify("tower_captured", {
@@ -563,9 +576,7 @@ class GameController(Subject, Observer):
     def _notify_tower_captured(self, tower, old_owner, new_owner):
         """Helper method để notify tower capture với sound effect"""
         # Play tower capture sound effect với volume thấp hơn để không đè lên các sound khác
-        from ..utils.sound_manager import SoundManager
-        sound_manager = SoundManager()
-        sound_manager.play("tower_destroy", volume=0.6)  # Giảm từ 0.8 xuống 0.6
+        self._sound_manager.play("tower_destroy", volume=0.6)  # Giảm từ 0.8 xuống 0.6
         
         # Notify observers about tower capture
         self.notify("tower_captured", {
@@ -628,7 +639,7 @@ class GameController(Subject, Observer):
                 target = ai_action.get('target')
                 total_troops = ai_action.get('total_troops', 0)
                 
-                print(f"AI Multi-Action ({action_type}): {len(attacks)} towers sending {total_troops} troops to ({target.x:.0f}, {target.y:.0f})")
+                logger.debug("AI Multi-Action (%s): %s towers sending %s troops to (%.0f, %.0f)", action_type, len(attacks), total_troops, target.x, target.y)
                 
                 # Create troop spawns for each attack with slight delays
                 for i, attack in enumerate(attacks):
@@ -651,7 +662,7 @@ class GameController(Subject, Observer):
                         ai_action['troops_count'],
                         OwnerType.ENEMY
                     )
-                    print(f"AI Single Action: Enemy sends {ai_action['troops_count']} troops from ({ai_action['source'].x:.0f}, {ai_action['source'].y:.0f}) to ({ai_action['target'].x:.0f}, {ai_action['target'].y:.0f})")
+                    logger.debug("AI Single Action: Enemy sends %s troops from (%.0f, %.0f) to (%.0f, %.0f)", ai_action['troops_count'], ai_action['source'].x, ai_action['source'].y, ai_action['target'].x, ai_action['target'].y)
         
         # Check win condition
         self._check_win_condition()
@@ -692,16 +703,16 @@ class GameController(Subject, Observer):
             total_enemy_strength = sum(t.count for _, t in enemy_troops)
             total_neutral_strength = sum(t.count for _, t in neutral_troops)
 
-            print(f"Tower at ({tower.x}, {tower.y}) - Owner: {tower.owner}, Troops: {tower.troops}")
-            print(f"Arrivals - Player: {total_player_strength}, Enemy: {total_enemy_strength}, Neutral: {total_neutral_strength}")
+            logger.debug("Tower at (%s, %s) - Owner: %s, Troops: %s", tower.x, tower.y, tower.owner, tower.troops)
+            logger.debug("Arrivals - Player: %s, Enemy: %s, Neutral: %s", total_player_strength, total_enemy_strength, total_neutral_strength)
 
             # Handle conflicts between player and enemy troops first
             if total_player_strength > 0 and total_enemy_strength > 0:
-                print(f"Player vs Enemy conflict at tower")
+                logger.debug("Player vs Enemy conflict at tower")
                 if total_player_strength > total_enemy_strength:
                     # Player wins
                     remaining_strength = total_player_strength - total_enemy_strength
-                    print(f"Player wins with {remaining_strength} remaining troops")
+                    logger.debug("Player wins with %s remaining troops", remaining_strength)
                     if remaining_strength > 0:
                         old_owner = tower.owner  # Lưu owner cũ trước khi attack
                         was_captured = tower.receive_attack(remaining_strength, OwnerType.PLAYER)
@@ -710,14 +721,14 @@ class GameController(Subject, Observer):
                 elif total_enemy_strength > total_player_strength:
                     # Enemy wins
                     remaining_strength = total_enemy_strength - total_player_strength
-                    print(f"Enemy wins with {remaining_strength} remaining troops")
+                    logger.debug("Enemy wins with %s remaining troops", remaining_strength)
                     if remaining_strength > 0:
                         old_owner = tower.owner  # Lưu owner cũ trước khi attack
                         was_captured = tower.receive_attack(remaining_strength, OwnerType.ENEMY)
                         if was_captured:
                             self._notify_tower_captured(tower, old_owner, OwnerType.ENEMY)
                 else:
-                    print(f"Equal strength - both sides cancel out")
+                    logger.debug("Equal strength - both sides cancel out")
                 # Mark all conflicting troops for removal
                 for i, _ in player_troops + enemy_troops:
                     if i not in troops_to_remove:
@@ -725,7 +736,7 @@ class GameController(Subject, Observer):
             else:
                 # No player vs enemy conflict - process each owner group separately
                 if total_player_strength > 0:
-                    print(f"Player attacking tower with {total_player_strength} troops")
+                    logger.debug("Player attacking tower with %s troops", total_player_strength)
                     old_owner = tower.owner  # Lưu owner cũ trước khi attack
                     was_captured = tower.receive_attack(total_player_strength, OwnerType.PLAYER)
                     if was_captured:
@@ -735,7 +746,7 @@ class GameController(Subject, Observer):
                             troops_to_remove.append(i)
 
                 if total_enemy_strength > 0:
-                    print(f"Enemy attacking tower with {total_enemy_strength} troops")
+                    logger.debug("Enemy attacking tower with %s troops", total_enemy_strength)
                     old_owner = tower.owner  # Lưu owner cũ trước khi attack
                     was_captured = tower.receive_attack(total_enemy_strength, OwnerType.ENEMY)
                     if was_captured:
@@ -745,7 +756,7 @@ class GameController(Subject, Observer):
                             troops_to_remove.append(i)
 
                 if total_neutral_strength > 0:
-                    print(f"Neutral attacking tower with {total_neutral_strength} troops")
+                    logger.debug("Neutral attacking tower with %s troops", total_neutral_strength)
                     old_owner = tower.owner  # Lưu owner cũ trước khi attack
                     was_captured = tower.receive_attack(total_neutral_strength, OwnerType.NEUTRAL)
                     if was_captured:
@@ -795,7 +806,7 @@ class GameController(Subject, Observer):
                     # Chỉ tính là chạm khi thực sự overlap (gần hơn cả chạm mép)
                     collision_threshold = max(troop1.radius, troop2.radius)  # Chỉ overlap mới combat
                     if distance <= collision_threshold:
-                        print(f"Combat detected: {troop1.owner} ({troop1.count}) at ({troop1.x:.1f},{troop1.y:.1f}) vs {troop2.owner} ({troop2.count}) at ({troop2.x:.1f},{troop2.y:.1f}) - distance: {distance:.1f}")
+                        logger.debug("Combat detected: %s (%s) at (%.1f,%.1f) vs %s (%s) at (%.1f,%.1f) - distance: %.1f", troop1.owner, troop1.count, troop1.x, troop1.y, troop2.owner, troop2.count, troop2.x, troop2.y, distance)
                         # Thực hiện combat
                         winner1, winner2 = troop1.combat_with(troop2)
                         # Mark cả 2 troops đã combat
@@ -803,10 +814,10 @@ class GameController(Subject, Observer):
                         troops_in_combat.add(j)
                         # Xử lý kết quả combat
                         if winner1 is None:
-                            print(f"Troop1 ({troop1.owner}) defeated")
+                            logger.debug("Troop1 (%s) defeated", troop1.owner)
                             troops_to_remove.append(i)
                         if winner2 is None:
-                            print(f"Troop2 ({troop2.owner}) defeated")
+                            logger.debug("Troop2 (%s) defeated", troop2.owner)
                             troops_to_remove.append(j)
                         # Play combat sound
                         self.notify("combat_occurred", {
@@ -821,7 +832,7 @@ class GameController(Subject, Observer):
                 troop = self._troops[i]
                 if hasattr(troop, 'is_dead') and troop.is_dead:
                     continue  # Giữ lại để vẽ dead animation
-                print(f"Removing defeated troop at index {i}")
+                logger.debug("Removing defeated troop at index %s", i)
                 del self._troops[i]
     
     def _find_target_tower(self, troop: Troop) -> Optional[Tower]:
@@ -842,7 +853,7 @@ class GameController(Subject, Observer):
             
             # PRIORITY 1: Troop đã trong vùng collision của tower
             if distance_from_troop <= tower_collision_radius:
-                print(f"Direct collision: Troop at ({troop.x:.1f}, {troop.y:.1f}) hit tower at ({tower.x}, {tower.y}) - distance: {distance_from_troop:.1f}")
+                logger.debug("Direct collision: Troop at (%.1f, %.1f) hit tower at (%s, %s) - distance: %.1f", troop.x, troop.y, tower.x, tower.y, distance_from_troop)
                 return tower
             
             # Track closest tower to target for secondary check
@@ -855,7 +866,7 @@ class GameController(Subject, Observer):
             # Additional check: troop should be moving towards this tower
             troop_to_closest = ((closest_tower.x - troop.x)**2 + (closest_tower.y - troop.y)**2)**0.5
             if troop_to_closest <= closest_tower.radius + 30:  # Generous buffer
-                print(f"Fallback collision: Troop at ({troop.x:.1f}, {troop.y:.1f}) caught by closest tower at ({closest_tower.x}, {closest_tower.y})")
+                logger.debug("Fallback collision: Troop at (%.1f, %.1f) caught by closest tower at (%s, %s)", troop.x, troop.y, closest_tower.x, closest_tower.y)
                 return closest_tower
             
         return None
@@ -866,18 +877,15 @@ class GameController(Subject, Observer):
         if self._game_ended or self._game_state in [GameState.GAME_OVER, GameState.LEVEL_COMPLETE]:
             return
             
-        # Đếm towers theo owner
-        owner_count = {}
-        for tower in self._towers:
-            owner = tower.owner
-            owner_count[owner] = owner_count.get(owner, 0) + 1
+        # Số towers theo owner đã được cập nhật sẵn
+        owner_count = self._tower_counts
         
-        print(f"Tower owners: {owner_count}")
+        logger.debug("Tower owners: %s", owner_count)
         
-        player_towers = owner_count.get(OwnerType.PLAYER, 0)
-        enemy_towers = owner_count.get(OwnerType.ENEMY, 0)
+        player_towers = owner_count[OwnerType.PLAYER]
+        enemy_towers = owner_count[OwnerType.ENEMY]
         
-        print(f"Player towers: {player_towers}, Enemy towers: {enemy_towers}")
+        logger.debug("Player towers: %s, Enemy towers: %s", player_towers, enemy_towers)
         
         # Kiểm tra win condition: một bên không còn tower nào
         winner = None
@@ -888,7 +896,7 @@ class GameController(Subject, Observer):
         
         if winner:
             self._game_ended = True  # Đánh dấu game đã kết thúc
-            print(f"WIN CONDITION MET! Winner: {winner}")
+            logger.debug("WIN CONDITION MET! Winner: %s", winner)
             old_state = self._game_state
             
             # Xử lý level progression
@@ -927,7 +935,7 @@ class GameController(Subject, Observer):
             
             self._winner = winner
             
-            print(f"Game state changed: {old_state} -> {self._game_state}")
+            logger.debug("Game state changed: %s -> %s", old_state, self._game_state)
             
             # Notify về state change
             self.notify("game_state_changed", {
@@ -935,14 +943,14 @@ class GameController(Subject, Observer):
                 "new_state": self._game_state
             })
             
-            print(f"Notifications sent - winner: {self._winner}")
+            logger.debug("Notifications sent - winner: %s", self._winner)
         else:
-            print("No winner yet, game continues")
+            logger.debug("No winner yet, game continues")
     
     def restart_game(self):
         """Restart game với level config hiện tại"""
         level_config = self._level_manager.get_current_level_config()
-        print(f"Starting {level_config['name']}...")
+        logger.debug("Starting %s...", level_config['name'])
         
         # Reset state
         old_state = self._game_state
@@ -994,12 +1002,10 @@ class GameController(Subject, Observer):
         # Ẩn pause menu nếu đang hiển thị
         self.notify("game_resumed", {})
         
-        print("Game restarted successfully")
+        logger.debug("Game restarted successfully")
     
     def _create_initial_towers_for_level(self, level_config: dict):
         """Tạo towers ban đầu theo config của level với vị trí động"""
-        import random
-        
         # Calculate dynamic positions
         positions = self._calculate_tower_positions()
         
@@ -1032,9 +1038,12 @@ class GameController(Subject, Observer):
         
         enemy_troops = level_config.get('enemy_initial_troops', level_config['initial_troops'])
         player_troops = level_config['initial_troops']
-        print(f"Created level: {level_config['player_towers']} player towers ({player_troops} troops each), "
-              f"{level_config['enemy_towers']} enemy towers ({enemy_troops} troops each), "
-              f"{level_config['neutral_towers']} neutral towers (dynamic positioning)")
+        logger.debug("Created level: %s player towers (%s troops each), "
+                     "%s enemy towers (%s troops each), "
+                     "%s neutral towers (dynamic positioning)",
+                     level_config['player_towers'], player_troops,
+                     level_config['enemy_towers'], enemy_troops,
+                     level_config['neutral_towers'])
     
     def pause_game(self):
         """Pause/unpause game"""
@@ -1042,10 +1051,10 @@ class GameController(Subject, Observer):
         
         if self._game_state == GameState.PLAYING:
             self._game_state = GameState.PAUSED
-            print("Game paused")
+            logger.debug("Game paused")
         elif self._game_state == GameState.PAUSED:
             self._game_state = GameState.PLAYING
-            print("Game resumed")
+            logger.debug("Game resumed")
         
         # Notify observers về state change
         self.notify("game_state_changed", {
@@ -1063,18 +1072,15 @@ class GameController(Subject, Observer):
         """Lấy thống kê game"""
         current_time = pygame.time.get_ticks()
         duration = current_time - self._game_start_time
-        
-        player_towers = len([t for t in self._towers if t.owner == OwnerType.PLAYER])
-        enemy_towers = len([t for t in self._towers if t.owner == OwnerType.ENEMY])
-        neutral_towers = len([t for t in self._towers if t.owner == OwnerType.NEUTRAL])
+        counts = self._tower_counts
         
         return {
             "game_duration": duration,
             "player_actions": self._player_actions,
             "total_battles": self._total_battles,
-            "player_towers": player_towers,
-            "enemy_towers": enemy_towers,
-            "neutral_towers": neutral_towers,
+            "player_towers": counts[OwnerType.PLAYER],
+            "enemy_towers": counts[OwnerType.ENEMY],
+            "neutral_towers": counts[OwnerType.NEUTRAL],
             "active_troops": len(self._troops),
             "ai_stats": self._ai_controller.get_performance_stats()
         }
@@ -1116,10 +1122,10 @@ class GameController(Subject, Observer):
                 game_data['troops'].append(troop_data)
             
             self._progression_manager.save(game_data)
-            print(f"Game state saved at level {self._level_manager.current_level}")
+            logger.debug("Game state saved at level %s", self._level_manager.current_level)
             
         except Exception as e:
-            print(f"Error saving game state: {e}")
+            logger.error("Error saving game state: %s", e)
     
     def check_auto_save(self):
         """Check if auto-save should be triggered"""
@@ -1,9 +1,12 @@
 """
 Level Manager - quản lý progression của game levels
 """
+import logging
 from typing import Dict, Any
 from ..utils.constants import LevelConfig
 
+logger = logging.getLogger(__name__)
+
 class LevelManager:
     """
     Quản lý các level trong game
@@ -30,9 +33,9 @@ class LevelManager:
         """Set level hiện tại"""
         if level in self.level_configs:
             self.current_level = level
-            print(f"Level set to {level}: {self.get_current_level_config()['name']}")
+            logger.debug("Level set to %s: %s", level, self.get_current_level_config()['name'])
         else:
-            print(f"Invalid level {level}, staying at {self.current_level}")
+            logger.warning("Invalid level %s, staying at %s", level, self.current_level)
     
     def complete_current_level(self) -> bool:
         """
@@ -43,17 +46,17 @@ class LevelManager:
         self.levels_completed.add(completed_level)
         
         if completed_level < self.max_level:
-            print(f"Level {completed_level} completed! Next level available: {completed_level + 1}")
+            logger.debug("Level %s completed! Next level available: %s", completed_level, completed_level + 1)
             return True
         else:
-            print("Congratulations! You completed all levels!")
+            logger.debug("Congratulations! You completed all levels!")
             return False
     
     def advance_to_next_level(self):
         """Chuyển sang level tiếp theo"""
         if self.current_level < self.max_level:
             self.current_level += 1
-            print(f"Advanced to {self.get_current_level_config()['name']}")
+            logger.debug("Advanced to %s", self.get_current_level_config()['name'])
             return True
         return False
     
@@ -61,7 +64,7 @@ class LevelManager:
         """Reset về level 1 khi thua"""
         self.current_level = 1
         self.levels_completed.clear()
-        print("Game Over! Returning to Level 1")
+        logger.debug("Game Over! Returning to Level 1")
     
     def get_level_info(self) -> str:
         """Lấy thông tin level hiện tại"""
@@ -12,6 +12,9 @@ from ..utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from ..utils.sound_manager import SoundManager
 from ..utils.transition import fade_out, fade_in
 
+# Màu clear mỗi lần vẽ overlay menu - tạo Color sẵn, fill không parse tuple
+_BLACK = pygame.Color(0, 0, 0)
+
 class MenuState(Enum):
     """Enum cho các trạng thái menu"""
     MAIN = "main"
@@ -148,16 +151,25 @@ class MenuManager:
         self.settings_menu.update_mouse_pos(pos)
         self.help_menu.update_mouse_pos(pos)
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng của menu hiện tại có thể thay đổi giữa 2 frame"""
+        if self.current_state == MenuState.SETTINGS:
+            return self.settings_menu.get_dirty_rects()
+        elif self.current_state == MenuState.HELP:
+            return self.help_menu.get_dirty_rects()
+        return self.main_menu.get_dirty_rects()
+    
     def draw(self, screen: pygame.Surface):
         """Vẽ current menu"""
         if self.current_state == MenuState.MAIN:
             self.main_menu.draw(screen)
         elif self.current_state == MenuState.SETTINGS:
-            # Draw main menu as background
+            # Main menu đang ẩn nên không vẽ background - clear trước khi vẽ overlay
+            screen.fill(_BLACK)
             self.main_menu.draw(screen)
             self.settings_menu.draw(screen)
         elif self.current_state == MenuState.HELP:
-            # Draw main menu as background
+            screen.fill(_BLACK)
             self.main_menu.draw(screen)
             self.help_menu.draw(screen)
     
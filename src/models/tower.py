@@ -4,15 +4,21 @@ Tower model - thể hiện tính Inheritance, Encapsulation, Polymorphism
 import pygame
 import math
 import random
+import logging
 from typing import Optional, Tuple
 from ..models.base import GameObject, Clickable, Subject
 from ..utils.constants import Colors, GameSettings, OwnerType
 
+logger = logging.getLogger(__name__)
+
 class Tower(GameObject, Clickable, Subject):
     """
     Lớp Tower kế thừa từ GameObject, implement Clickable interface
     và Subject cho Observer pattern
     """
+
+    # Font cache theo size, dùng chung cho mọi tower (tránh SysFont mỗi frame)
+    _font_cache = {}
     
     def __init__(self, x: float, y: float, owner: str = OwnerType.NEUTRAL, troops: int = 20):
         # Gọi constructor của parent classes
@@ -45,6 +51,10 @@ class Tower(GameObject, Clickable, Subject):
         self.__growth_rate = GameSettings.TOWER_GROWTH_RATE
         self.__last_growth_time = pygame.time.get_ticks()
         self._selected = False
+
+        # Cache surface số quân - chỉ render lại khi số quân hoặc font size đổi
+        self.__text_key = None
+        self.__text_surfaces = None
         
         # Validate input
         self.__validate_owner(owner)
@@ -246,22 +256,34 @@ class Tower(GameObject, Clickable, Subject):
         # Vẽ số quân với font đẹp hơn
         self.__draw_troops_text(screen)
     
+    @classmethod
+    def _get_troops_font(cls, font_size: int) -> pygame.font.Font:
+        """Lấy font số quân từ cache theo size"""
+        font = cls._font_cache.get(font_size)
+        if font is None:
+            try:
+                font = pygame.font.SysFont('Arial', font_size, bold=True)
+            except:
+                # Fallback nếu không có Arial
+                font = pygame.font.Font(None, font_size)
+            cls._font_cache[font_size] = font
+        return font
+
     def __draw_troops_text(self, screen: pygame.Surface):
         """Private method để vẽ text số quân - Encapsulation"""
-        try:
-            # Scale font size based on current scale
-            font_size = max(12, int(GameSettings.FONT_MEDIUM * self._scale))
-            font = pygame.font.SysFont('Arial', font_size, bold=True)
-        except:
-            # Fallback nếu không có Arial
-            font_size = max(12, int(GameSettings.FONT_MEDIUM * self._scale))
-            font = pygame.font.Font(None, font_size)
-        
-        text = font.render(str(self.__troops), True, Colors.WHITE)
+        # Scale font size based on current scale
+        font_size = max(12, int(GameSettings.FONT_MEDIUM * self._scale))
+        key = (self.__troops, font_size)
+        if key != self.__text_key:
+            font = self._get_troops_font(font_size)
+            troops_str = str(self.__troops)
+            # Text trắng + shadow đen để dễ đọc hơn
+            self.__text_surfaces = (font.render(troops_str, True, Colors.WHITE),
+                                    font.render(troops_str, True, Colors.BLACK))
+            self.__text_key = key
+        text, shadow = self.__text_surfaces
+
         text_rect = text.get_rect(midbottom=(self.x, self.y - self.radius - int(4 * self._scale)))
-        
-        # Vẽ shadow cho text để dễ đọc hơn
-        shadow = font.render(str(self.__troops), True, Colors.BLACK)
         shadow_rect = shadow.get_rect(midbottom=(self.x + 1, self.y - self.radius - int(3 * self._scale)))
 
         screen.blit(shadow, shadow_rect)
@@ -292,7 +314,7 @@ class Tower(GameObject, Clickable, Subject):
     def can_send_troops(self) -> bool:
         """Kiểm tra xem có thể gửi quân không"""
         result = self.__troops > 0 and self.__owner != OwnerType.NEUTRAL
-        print(f"Tower can_send_troops: troops={self.__troops}, owner={self.__owner}, result={result}")
+        logger.debug("Tower can_send_troops: troops=%s, owner=%s, result=%s", self.__troops, self.__owner, result)
         return result
     
     def send_troops(self, target: 'Tower') -> int:
@@ -300,10 +322,10 @@ class Tower(GameObject, Clickable, Subject):
         Gửi quân đến tower khác
         Trả về số quân được gửi
         """
-        print(f"Tower send_troops called: can_send={self.can_send_troops()}")
+        logger.debug("Tower send_troops called: can_send=%s", self.can_send_troops())
         
         if not self.can_send_troops():
-            print(f"Tower send_troops: Cannot send troops")
+            logger.debug("Tower send_troops: Cannot send troops")
             return 0
         
         # Đảm bảo gửi ít nhất 1 troop, nhưng không gửi hết
@@ -312,10 +334,10 @@ class Tower(GameObject, Clickable, Subject):
             troops_to_send = self.__troops - 1  # Giữ lại ít nhất 1 troop
         
         if troops_to_send <= 0:
-            print(f"Tower send_troops: No troops to send (calculated {troops_to_send})")
+            logger.debug("Tower send_troops: No troops to send (calculated %s)", troops_to_send)
             return 0
             
-        print(f"Tower send_troops: Sending {troops_to_send} troops, remaining {self.__troops - troops_to_send}")
+        logger.debug("Tower send_troops: Sending %s troops, remaining %s", troops_to_send, self.__troops - troops_to_send)
         self.troops = self.__troops - troops_to_send
         
         # Notify observers
@@ -351,7 +373,7 @@ class Tower(GameObject, Clickable, Subject):
                 self.troops = remaining_troops
                 if remaining_troops > 0: # hiệu ứng giật
                     self.trigger_bump()
-                print(f"Tower captured! {old_owner} -> {attacker_owner} với {remaining_troops} quân")
+                logger.debug("Tower captured! %s -> %s với %s quân", old_owner, attacker_owner, remaining_troops)
                 return True
             else:
                 # Tower không bị chiếm, chỉ giảm quân
@@ -362,6 +384,12 @@ class Tower(GameObject, Clickable, Subject):
         """Tính khoảng cách đến tower khác"""
         return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
     
+    def distance_sq_to(self, other: 'Tower') -> float:
+        """Bình phương khoảng cách - đủ để so sánh gần/xa, không cần sqrt"""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+    
     def __str__(self) -> str:
         """String representation của tower"""
         return f"Tower({self.owner}, {self.__troops} troops) at ({self.x}, {self.y})"
@@ -3,15 +3,21 @@ Troop model - thể hiện tính Inheritance, Encapsulation, Polymorphism
 """
 import pygame
 import math
+import logging
 from typing import Tuple
 from ..models.base import GameObject, Movable
 from ..utils.constants import Colors, GameSettings, OwnerType
 
+logger = logging.getLogger(__name__)
+
 class Troop(GameObject, Movable):
     """
     Lớp Troop kế thừa từ GameObject và implement Movable interface
     Đại diện cho các đơn vị quân di chuyển giữa các tower
     """
+
+    # Font số quân dùng chung cho mọi troop (tạo lazy lần đầu vẽ)
+    _count_font = None
     
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float, 
                  owner: str, count: int):
@@ -30,6 +36,10 @@ class Troop(GameObject, Movable):
         self._in_formation_phase = False
         self._is_first_in_formation = False
         self._formation_id = None
+
+        # Cache surface số quân - chỉ render lại khi count đổi
+        self.__count_key = None
+        self.__count_surface = None
         
         # Tính toán vector di chuyển
         self.__dx, self.__dy = self.__calculate_movement_vector()
@@ -189,14 +199,22 @@ class Troop(GameObject, Movable):
         # Vẽ số quân
         self.__draw_count_text(screen)
     
+    @classmethod
+    def _get_count_font(cls) -> pygame.font.Font:
+        """Lấy font số quân dùng chung, tạo một lần duy nhất"""
+        if cls._count_font is None:
+            try:
+                cls._count_font = pygame.font.SysFont('Arial', GameSettings.FONT_SMALL, bold=True)
+            except:
+                cls._count_font = pygame.font.Font(None, GameSettings.FONT_SMALL)
+        return cls._count_font
+
     def __draw_count_text(self, screen: pygame.Surface):
         """Private method để vẽ số lượng quân - Encapsulation"""
-        try:
-            font = pygame.font.SysFont('Arial', GameSettings.FONT_SMALL, bold=True)
-        except:
-            font = pygame.font.Font(None, GameSettings.FONT_SMALL)
-        
-        text = font.render(str(self.__count), True, Colors.WHITE)
+        if self.__count != self.__count_key:
+            self.__count_surface = self._get_count_font().render(str(self.__count), True, Colors.WHITE)
+            self.__count_key = self.__count
+        text = self.__count_surface
         text_rect = text.get_rect(center=(self.x, self.y - 15))
         
         # Vẽ background cho text để dễ đọc
@@ -213,7 +231,7 @@ class Troop(GameObject, Movable):
         if distance_to_new_target > 5.0:  # Threshold để tránh update liên tục
             self.__target_x = new_target_x
             self.__target_y = new_target_y
-            print(f"Updated target for troop at ({self.x:.1f}, {self.y:.1f}) to ({new_target_x:.1f}, {new_target_y:.1f})")
+            logger.debug("Updated target for troop at (%.1f, %.1f) to (%.1f, %.1f)", self.x, self.y, new_target_x, new_target_y)
     
     def distance_to_target(self) -> float:
         """Tính khoảng cách đến target"""
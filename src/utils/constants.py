@@ -2,6 +2,7 @@
 Constants module chứa tất cả các hằng số được sử dụng trong game
 """
 import pygame
+from enum import IntEnum
 
 # Kích thước màn hình
 SCREEN_WIDTH = 1024
@@ -30,6 +31,10 @@ class Colors:
 class GameSettings:
     """Class chứa các cài đặt game"""
     FPS = 60
+    IDLE_FPS = 30  # FPS khi ở menu / pause - không cần render 60 Hz
+    FIXED_TIMESTEP = 1.0 / 60  # seconds - bước update cố định cho game logic
+    MAX_FRAME_TIME = 0.25      # seconds - giới hạn dt mỗi frame, tránh "spiral of death"
+    IDLE_EVENT_TIMEOUT = 100   # ms - menu tĩnh ngủ chờ input tối đa bấy nhiêu trước khi chạy frame
     TOWER_RADIUS = 30
     TOWER_MAX_TROOPS = 50 
     TOWER_GROWTH_RATE = 1
@@ -56,6 +61,13 @@ class GameState:
     PAUSED = 'paused'
     LEVEL_COMPLETE = 'level_complete'
 
+class AppState(IntEnum):
+    """Enum cho các màn hình của ứng dụng"""
+    MENU = 0
+    LEVEL_SELECT = 1
+    GAME = 2
+    RESULT = 3
+
 class LevelConfig:
     """Level configuration với advanced AI difficulty scaling"""
     LEVEL_1 = {
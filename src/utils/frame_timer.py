@@ -0,0 +1,32 @@
+"""
+Frame timer - frame pacing bằng time.perf_counter (monotonic, độ phân giải cao)
+"""
+import time
+
+# Ngủ thô tới còn cách deadline bấy nhiêu giây, đoạn cuối chờ bằng vòng sleep(0)
+# (timer của OS có thể trễ ~1-10 ms nên không ngủ thẳng tới deadline)
+_SPIN_MARGIN = 0.002
+
+class FrameTimer:
+    """
+    Thay thế pygame.time.Clock: cùng interface tick(framerate) -> ms.
+    Khi frame xong sớm: time.sleep phần lớn thời gian còn dư, rồi nhường CPU bằng
+    sleep(0) tới đúng ranh giới frame - dt đều hơn so với chỉ dùng timer ms của SDL.
+    """
+
+    def __init__(self):
+        self._last = time.perf_counter()
+
+    def tick(self, framerate: float = 0) -> float:
+        """Chờ tới hết frame nếu còn dư, trả về số ms kể từ lần tick trước"""
+        if framerate:
+            deadline = self._last + 1.0 / framerate
+            remaining = deadline - time.perf_counter()
+            if remaining > _SPIN_MARGIN:
+                time.sleep(remaining - _SPIN_MARGIN)
+            while time.perf_counter() < deadline:
+                time.sleep(0)
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last) * 1000.0
+        self._last = now
+        return elapsed_ms
@@ -4,9 +4,12 @@ Thể hiện Singleton Pattern để cache images
 """
 import pygame
 import os
+import logging
 from typing import Dict, Optional
 from ..utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TOWER_SIZE
 
+logger = logging.getLogger(__name__)
+
 class ImageManager:
     """
     Singleton Image Manager
@@ -54,11 +57,11 @@ class ImageManager:
             
             # Cache image
             self.images[filename] = image
-            print(f"Loaded image: {filename}")
+            logger.debug("Loaded image: %s", filename)
             return image
             
         except pygame.error as e:
-            print(f"Could not load image {filename}: {e}")
+            logger.warning("Could not load image %s: %s", filename, e)
             return None
     
     def get_background(self) -> Optional[pygame.Surface]:
@@ -135,4 +138,4 @@ class ImageManager:
     def clear_cache(self):
         """Clear image cache"""
         self.images.clear()
-        print("Image cache cleared")
+        logger.debug("Image cache cleared")
@@ -2,6 +2,10 @@ import json
 import os
 
 class ProgressionManager:
+    # Nội dung đã ghi gần nhất theo save_path - dùng chung cho mọi instance
+    # (main và GameController cùng ghi 1 file) để bỏ qua các lần save trùng nội dung
+    _last_written = {}
+
     def __init__(self, save_path=None):
         if save_path is None:
             from .path_utils import get_save_path
@@ -9,11 +13,22 @@ class ProgressionManager:
         self.save_path = save_path
 
     def save(self, data):
+        # dumps không indent dùng encoder C của json, ghi file bằng 1 lần write
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        if ProgressionManager._last_written.get(self.save_path) == payload and os.path.exists(self.save_path):
+            return
         with open(self.save_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write(payload)
+        ProgressionManager._last_written[self.save_path] = payload
 
     def load(self):
         if not os.path.exists(self.save_path):
             return None
         with open(self.save_path, 'r', encoding='utf-8') as f:
             return json.load(f)
+
+    def clear(self):
+        """Xóa file save (nếu có)"""
+        ProgressionManager._last_written.pop(self.save_path, None)
+        if os.path.exists(self.save_path):
+            os.remove(self.save_path)
@@ -1,7 +1,10 @@
 import pygame
 import os
+import logging
 from typing import Dict
 
+logger = logging.getLogger(__name__)
+
 class SoundManager:
     _instance = None
 
@@ -29,6 +32,9 @@ class SoundManager:
         self._sfx_volume = 0.7
         self._muted = False
         
+        # Tên file nhạc phát gần nhất, None sau khi stop - chỉ tin khi mixer còn đang phát
+        self._current_music_file = None
+        
         self._initialized = True
 
     @property
@@ -61,12 +67,12 @@ class SoundManager:
         # Update currently playing music volume
         final_volume = self._music_volume * self._master_volume
         pygame.mixer.music.set_volume(final_volume)
-        print(f"[SoundManager] Music volume set to {self._music_volume} (final: {final_volume})")
+        logger.debug("[SoundManager] Music volume set to %s (final: %s)", self._music_volume, final_volume)
     
     def set_sfx_volume(self, volume: float):
         """Set sound effects volume (0.0 to 1.0)"""
         self._sfx_volume = max(0.0, min(1.0, volume))
-        print(f"[SoundManager] SFX volume set to {self._sfx_volume}")
+        logger.debug("[SoundManager] SFX volume set to %s", self._sfx_volume)
 
     def is_music_playing(self):
         """Check if music is currently playing"""
@@ -74,17 +80,22 @@ class SoundManager:
     
     def get_current_music_file(self):
         """Get currently playing music file name (we'll track this)"""
-        return getattr(self, '_current_music_file', None)
+        return self._current_music_file
     
     def _set_current_music_file(self, filename):
         """Internal method to track current music file"""
         self._current_music_file = filename
+    
+    def _is_playing_file(self, filename):
+        """True nếu filename đang phát - khác file thì không cần hỏi mixer"""
+        # Mixer có thể tự dừng (hết bài không lặp, stop ở chỗ khác) nên vẫn kiểm tra get_busy
+        return self._current_music_file == filename and pygame.mixer.music.get_busy()
 
     def play_background_music(self, filename="background_music.mp3", volume=None):
         """Play background music for menus"""
         # Don't restart if same music is already playing
-        if self.is_music_playing() and self.get_current_music_file() == filename:
-            print(f"[SoundManager] Background music {filename} already playing, continuing...")
+        if self._is_playing_file(filename):
+            logger.debug("[SoundManager] Background music %s already playing, continuing...", filename)
             return
             
         if volume is None:
@@ -98,15 +109,16 @@ class SoundManager:
             pygame.mixer.music.set_volume(final_volume)
             pygame.mixer.music.play(-1)  # -1 để phát lặp lại vô hạn
             self._set_current_music_file(filename)
-            print(f"[SoundManager] Background music started. Volume: {final_volume}")
+            logger.debug("[SoundManager] Background music started. Volume: %s", final_volume)
         except pygame.error as e:
-            print(f"[SoundManager] Failed to load background music: {e}")
+            self._set_current_music_file(None)
+            logger.warning("[SoundManager] Failed to load background music: %s", e)
 
     def play_gameview_music(self, filename="gameview_music.mp3", volume=None):
         """Play music for game view"""
         # Don't restart if same music is already playing
-        if self.is_music_playing() and self.get_current_music_file() == filename:
-            print(f"[SoundManager] Gameview music {filename} already playing, continuing...")
+        if self._is_playing_file(filename):
+            logger.debug("[SoundManager] Gameview music %s already playing, continuing...", filename)
             return
             
         if volume is None:
@@ -120,15 +132,16 @@ class SoundManager:
             pygame.mixer.music.set_volume(final_volume)
             pygame.mixer.music.play(-1)  # -1 để phát lặp lại vô hạn
             self._set_current_music_file(filename)
-            print(f"[SoundManager] Gameview music started. Volume: {final_volume}")
+            logger.debug("[SoundManager] Gameview music started. Volume: %s", final_volume)
         except pygame.error as e:
-            print(f"[SoundManager] Failed to load gameview music: {e}")
+            self._set_current_music_file(None)
+            logger.warning("[SoundManager] Failed to load gameview music: %s", e)
 
     def play_intro_music(self, filename="sound_intro.mp3", volume=None):
         """Play music for intro screen"""
         # Don't restart if same music is already playing
-        if self.is_music_playing() and self.get_current_music_file() == filename:
-            print(f"[SoundManager] Intro music {filename} already playing, continuing...")
+        if self._is_playing_file(filename):
+            logger.debug("[SoundManager] Intro music %s already playing, continuing...", filename)
             return
             
         if volume is None:
@@ -142,9 +155,10 @@ class SoundManager:
             pygame.mixer.music.set_volume(final_volume)
             pygame.mixer.music.play(-1)  # -1 để phát lặp lại vô hạn
             self._set_current_music_file(filename)
-            print(f"[SoundManager] Intro music started. Volume: {final_volume}")
+            logger.debug("[SoundManager] Intro music started. Volume: %s", final_volume)
         except pygame.error as e:
-            print(f"[SoundManager] Failed to load intro music: {e}")
+            self._set_current_music_file(None)
+            logger.warning("[SoundManager] Failed to load intro music: %s", e)
 
     def load_sound(self, name: str, filename: str):
         """Load và cache âm thanh nếu chưa có"""
@@ -152,9 +166,9 @@ class SoundManager:
             path = os.path.join(self.sounds_folder, filename)
             try:
                 self.sounds[name] = pygame.mixer.Sound(path)
-                print(f"[SoundManager] Loaded sound: {filename}")
+                logger.debug("[SoundManager] Loaded sound: %s", filename)
             except pygame.error as e:
-                print(f"[SoundManager] Error loading {filename}: {e}")
+                logger.warning("[SoundManager] Error loading %s: %s", filename, e)
 
     def play(self, name: str, volume: float = None):
         """Play âm thanh theo tên với volume control - chỉ bị ảnh hưởng bởi SFX volume"""
@@ -189,11 +203,15 @@ class SoundManager:
     def stop_all(self):
         pygame.mixer.stop()
         pygame.mixer.music.stop()
+        self._current_music_file = None
 
     def play_music(self, music_path, volume=0.5, loop=True):
+        self._current_music_file = None  # load lỗi thì không còn biết bài nào đang phát
         pygame.mixer.music.load(music_path)
         pygame.mixer.music.set_volume(volume)
         pygame.mixer.music.play(-1 if loop else 0)
+        self._current_music_file = os.path.basename(music_path)
 
     def stop_music(self):
         pygame.mixer.music.stop()
+        self._current_music_file = None
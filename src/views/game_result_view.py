@@ -32,6 +32,10 @@ class GameResultView:
         self.animation_time = 0
         self.show_animation = True
         
+        # Memoize phần nền tĩnh (overlay, container, title) - chỉ build lại khi nội dung/size đổi
+        self._background = None
+        self._background_key = None
+        
     def setup_win_buttons(self, current_level, has_next_level, screen_width, screen_height):
         """Setup buttons cho trường hợp thắng"""
         self.buttons.clear()
@@ -114,6 +118,10 @@ class GameResultView:
         
         return None
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame (buttons hover)"""
+        return [button["rect"] for button in self.buttons.values()]
+    
     def update(self, dt):
         """Update animations"""
         self.animation_time += dt
@@ -121,51 +129,31 @@ class GameResultView:
     def draw_win_screen(self, screen, current_level, has_next_level, all_complete=False):
         """Vẽ win screen"""
         # Get current screen dimensions
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        
-        # Semi-transparent background
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 100, 0, 180))  # Green tint
-        screen.blit(overlay, (0, 0))
-        
-        # Main container
-        container_width = 400
-        container_height = 300
-        container_x = (screen_width - container_width) // 2
-        container_y = (screen_height - container_height) // 2
-        
-        container_rect = pygame.Rect(container_x, container_y, container_width, container_height)
-        pygame.draw.rect(screen, Colors.WHITE, container_rect)
-        pygame.draw.rect(screen, Colors.GREEN, container_rect, 5)
-        
-        # Title
-        if all_complete:
-            title_text = "All Levels Complete!"
-        else:
-            title_text = f"Level {current_level} Complete!"
-        
-        title_surface = self.font_title.render(title_text, True, Colors.GREEN)
-        title_rect = title_surface.get_rect(center=(container_x + container_width // 2, container_y + 60))
-        screen.blit(title_surface, title_rect)
-        
-        # Subtitle
-        if all_complete:
-            subtitle_text = "You've conquered all challenges!"
-        elif has_next_level:
-            subtitle_text = f"Ready for Level {current_level + 1}?"
-        else:
-            subtitle_text = "Congratulations!"
-        
-        subtitle_surface = self.font_subtitle.render(subtitle_text, True, Colors.DARK_BLUE)
-        subtitle_rect = subtitle_surface.get_rect(center=(container_x + container_width // 2, container_y + 100))
-        screen.blit(subtitle_surface, subtitle_rect)
+        screen_size = screen.get_size()
+        
+        key = ("win", current_level, has_next_level, all_complete, screen_size)
+        if key != self._background_key:
+            # Title
+            if all_complete:
+                title_text = "All Levels Complete!"
+            else:
+                title_text = f"Level {current_level} Complete!"
+            
+            # Subtitle
+            if all_complete:
+                subtitle_text = "You've conquered all challenges!"
+            elif has_next_level:
+                subtitle_text = f"Ready for Level {current_level + 1}?"
+            else:
+                subtitle_text = "Congratulations!"
+            
+            self._build_background(key, screen_size, (0, 100, 0, 180), Colors.GREEN,
+                                   title_text, subtitle_text)  # Green tint
+            
+            # Setup buttons
+            self.setup_win_buttons(current_level, has_next_level and not all_complete, *screen_size)
         
-        # Setup buttons
-        if all_complete:
-            self.setup_win_buttons(current_level, False, screen_width, screen_height)
-        else:
-            self.setup_win_buttons(current_level, has_next_level, screen_width, screen_height)
+        screen.blit(self._background, (0, 0))
         
         # Draw buttons
         self._draw_buttons(screen)
@@ -173,13 +161,28 @@ class GameResultView:
     def draw_lose_screen(self, screen, current_level):
         """Vẽ lose screen"""
         # Get current screen dimensions
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
+        screen_size = screen.get_size()
+        
+        key = ("lose", current_level, screen_size)
+        if key != self._background_key:
+            self._build_background(key, screen_size, (100, 0, 0, 180), Colors.RED,
+                                   f"Level {current_level} Failed", "Try again?")  # Red tint
+            
+            # Setup buttons
+            self.setup_lose_buttons(*screen_size)
+        
+        screen.blit(self._background, (0, 0))
+        self._draw_buttons(screen)
+    
+    def _build_background(self, key, screen_size, tint, accent_color, title_text, subtitle_text):
+        """Render phần nền tĩnh của result screen vào surface cache"""
+        screen_width, screen_height = screen_size
+        background = pygame.Surface(screen_size)  # Nền đen
         
         # Semi-transparent background
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((100, 0, 0, 180))  # Red tint
-        screen.blit(overlay, (0, 0))
+        overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
+        overlay.fill(tint)
+        background.blit(overlay, (0, 0))
         
         # Main container
         container_width = 400
@@ -188,24 +191,21 @@ class GameResultView:
         container_y = (screen_height - container_height) // 2
         
         container_rect = pygame.Rect(container_x, container_y, container_width, container_height)
-        pygame.draw.rect(screen, Colors.WHITE, container_rect)
-        pygame.draw.rect(screen, Colors.RED, container_rect, 5)
+        pygame.draw.rect(background, Colors.WHITE, container_rect)
+        pygame.draw.rect(background, accent_color, container_rect, 5)
         
         # Title
-        title_text = f"Level {current_level} Failed"
-        title_surface = self.font_title.render(title_text, True, Colors.RED)
+        title_surface = self.font_title.render(title_text, True, accent_color)
         title_rect = title_surface.get_rect(center=(container_x + container_width // 2, container_y + 60))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
         
         # Subtitle
-        subtitle_text = "Try again?"
         subtitle_surface = self.font_subtitle.render(subtitle_text, True, Colors.DARK_BLUE)
         subtitle_rect = subtitle_surface.get_rect(center=(container_x + container_width // 2, container_y + 100))
-        screen.blit(subtitle_surface, subtitle_rect)
+        background.blit(subtitle_surface, subtitle_rect)
         
-        # Setup and draw buttons
-        self.setup_lose_buttons(screen_width, screen_height)
-        self._draw_buttons(screen)
+        self._background = background
+        self._background_key = key
     
     def _draw_buttons(self, screen):
         """Vẽ buttons"""
@@ -232,3 +232,4 @@ class GameResultView:
         """Reset animation state"""
         self.animation_time = 0
         self.show_animation = True
+        self._background_key = None  # Kết quả mới - build lại nền
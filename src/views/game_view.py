@@ -4,6 +4,8 @@ Thể hiện MVC Pattern và Observer Pattern
 """
 import pygame
 import os
+import math
+import logging
 from typing import List
 from ..models.base import Observer
 from ..models.tower import Tower
@@ -11,6 +13,17 @@ from ..models.troop import Troop
 from ..views.ui_view import GameHUD, GameOverScreen, PauseMenu
 from ..utils.constants import Colors, SCREEN_WIDTH, SCREEN_HEIGHT, GameState, GameSettings
 
+logger = logging.getLogger(__name__)
+
+# Màu dùng mỗi frame - tạo pygame.Color sẵn để fill/draw không phải parse tuple mỗi lần
+_BLACK = pygame.Color(Colors.BLACK)
+_GRID_COLOR = pygame.Color(230, 230, 230)
+# Màu preview line - alpha do preview_surface.set_alpha quyết định nên chỉ cần RGB
+_PREVIEW_OWN = pygame.Color(0, 255, 0)        # Green
+_PREVIEW_NEUTRAL = pygame.Color(255, 255, 0)  # Yellow
+_PREVIEW_ENEMY = pygame.Color(255, 0, 0)      # Red
+_PREVIEW_EMPTY = pygame.Color(255, 255, 255)  # White
+
 class GameView(Observer):
     class DeadTroopAnim:
         def __init__(self, x, y, owner, size, start_time, animation_manager):
@@ -92,9 +105,14 @@ class GameView(Observer):
         animations_path = get_animations_path()
         self.animation_manager = AnimationManager(animations_path)
         self.background_image = self.image_manager.get_image("background_game")
+        self._scaled_background = None  # background_image đã scale + convert theo kích thước surface
+        self._scaled_background_size = None
         
         # Scaling factor for consistent rendering
         self.scale_factor = 1.0
+        self.inv_scale_factor = 1.0  # 1 / scale_factor - đổi tọa độ chuột bằng phép nhân
+        self.offset_x = 0
+        self.offset_y = 0
         
         # UI Components
         self.hud = GameHUD()
@@ -124,6 +142,14 @@ class GameView(Observer):
         
         # Performance optimization
         self.dirty_rects = []
+        # Fullscreen: surface game-resolution và bản scale, giữ lại giữa các frame
+        self._game_surface = None
+        self._scaled_surface = None
+        # (size, bitsize) của display lúc tạo 2 surface trên - set_mode có thể trả lại
+        # cùng object Surface sau khi tạo lại cửa sổ nên không so bằng identity
+        self._scale_target = None
+        # Khi pause: ảnh cảnh game + HUD bên dưới pause menu, chụp 1 lần lúc vào pause
+        self._paused_frame = None
     
     def update_observer(self, event_type: str, data: dict):
         """
@@ -132,7 +158,7 @@ class GameView(Observer):
         """
         if event_type == "game_state_changed":
             self.game_state = data.get('new_state', GameState.PLAYING)
-            print(f"GameView: Game state changed to {self.game_state}")
+            logger.debug("GameView: Game state changed to %s", self.game_state)
         
         elif event_type == "towers_updated":
             self.towers = data.get('towers', [])
@@ -192,7 +218,7 @@ class GameView(Observer):
             # Reset level complete dialog
             self.show_level_complete_dialog = False
             self.level_complete_data = None
-            print(f"GameView: Game over! Winner: {data.get('winner')}")
+            logger.debug("GameView: Game over! Winner: %s", data.get('winner'))
         
         elif event_type == "level_complete":
             self.game_state = GameState.LEVEL_COMPLETE
@@ -200,7 +226,7 @@ class GameView(Observer):
             self.show_level_complete_dialog = False
             self.level_complete_data = None
             self._level_complete_surface = None
-            print(f"GameView: Level complete! Letting main.py handle dialog")
+            logger.debug("GameView: Level complete! Letting main.py handle dialog")
         
         elif event_type == "all_levels_complete":
             self.game_state = GameState.GAME_OVER
@@ -208,7 +234,7 @@ class GameView(Observer):
             # Reset level complete dialog
             self.show_level_complete_dialog = False
             self.level_complete_data = None
-            print("GameView: All levels completed!")
+            logger.debug("GameView: All levels completed!")
         
         elif event_type == "game_restarted":
             self.game_over_screen.update_observer(event_type, data)
@@ -217,7 +243,7 @@ class GameView(Observer):
             self.game_state = GameState.PLAYING
             self.pause_menu.visible = False
             level_info = data.get('level_info', '')
-            print(f"GameView: Game restarted - {level_info}")
+            logger.debug("GameView: Game restarted - %s", level_info)
         
         elif event_type == "level_started":
             self.hud.update_observer(event_type, data)  # Forward to HUD
@@ -225,11 +251,11 @@ class GameView(Observer):
             self.show_level_complete_dialog = False
             self.level_complete_data = None
             self._level_complete_surface = None  # Clear cached surface
-            print(f"GameView: Level {data.get('level', '')} started - {data.get('level_info', '')}")
+            logger.debug("GameView: Level %s started - %s", data.get('level', ''), data.get('level_info', ''))
         
         elif event_type == "level_changed":
             self.hud.update_observer(event_type, data)  # Forward to HUD
-            print(f"GameView: Level changed - {data.get('level_info', '')}")
+            logger.debug("GameView: Level changed - %s", data.get('level_info', ''))
     
     def set_towers(self, towers: List[Tower]):
         """Update towers list"""
@@ -275,6 +301,7 @@ class GameView(Observer):
         """Show pause menu"""
         self.pause_menu.visible = True
         self.pause_menu_visible = True
+        self._paused_frame = None  # Chụp lại cảnh bên dưới ở lần vẽ pause tiếp theo
     
     def hide_pause_menu(self):
         """Hide pause menu"""
@@ -285,41 +312,32 @@ class GameView(Observer):
         """Toggle grid display"""
         self.show_grid = not self.show_grid
     
-    def draw(self, dt: float):
+    def draw(self, dt: float, surface: pygame.Surface = None):
         """
         Main draw method
         Template Method Pattern - định nghĩa skeleton của rendering process
+        surface: đích vẽ, mặc định là self.screen - view không bị đổi state khi vẽ
         """
+        target = surface if surface is not None else self.screen
         # For native fullscreen, we need to handle scaling differently
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
+        screen_width = target.get_width()
+        screen_height = target.get_height()
         
         # Check if we're in fullscreen mode (screen size != original game size)
         is_fullscreen = (screen_width != SCREEN_WIDTH or screen_height != SCREEN_HEIGHT)
         
         if is_fullscreen:
-            # Create a game surface at original resolution
-            game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            # Game surface at original resolution - tạo lại khi display đổi (toggle fullscreen)
+            scale_target = (target.get_size(), target.get_bitsize())
+            if self._scale_target != scale_target:
+                self._game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+                self._scaled_surface = None
+                self._scale_target = scale_target
+            game_surface = self._game_surface
             self.scale_factor = 1.0  # No scaling on game surface
             
-            # Temporarily switch to game surface for rendering
-            original_screen = self.screen
-            self.screen = game_surface
-            
-            # Clear game surface
-            self._clear_screen()
-            
-            # Draw background elements
-            self._draw_background()
-            
-            # Draw game objects
-            self._draw_game_objects(dt)
-            
-            # Draw UI
-            self._draw_ui()
-            
-            # Restore original screen
-            self.screen = original_screen
+            # Render at original resolution into the game surface
+            self._draw_frame(game_surface, dt)
             
             # Calculate scale to fit screen while maintaining aspect ratio
             scale_x = screen_width / SCREEN_WIDTH
@@ -333,14 +351,19 @@ class GameView(Observer):
             offset_y = (screen_height - scaled_height) // 2
             
             # Clear screen with black bars
-            self.screen.fill((0, 0, 0))
+            target.fill(_BLACK)
             
-            # Scale and blit game surface to screen
-            scaled_surface = pygame.transform.scale(game_surface, (scaled_width, scaled_height))
-            self.screen.blit(scaled_surface, (offset_x, offset_y))
+            # Scale vào surface đích có sẵn rồi blit ra screen
+            scaled_size = (scaled_width, scaled_height)
+            scaled_surface = self._scaled_surface
+            if scaled_surface is None or scaled_surface.get_size() != scaled_size:
+                scaled_surface = self._scaled_surface = pygame.Surface(scaled_size).convert()
+            pygame.transform.scale(game_surface, scaled_size, scaled_surface)
+            target.blit(scaled_surface, (offset_x, offset_y))
             
             # Store scaling info for mouse input translation
             self.scale_factor = scale
+            self.inv_scale_factor = 1.0 / scale
             self.offset_x = offset_x
             self.offset_y = offset_y
         else:
@@ -348,89 +371,131 @@ class GameView(Observer):
             scale_x = screen_width / SCREEN_WIDTH
             scale_y = screen_height / SCREEN_HEIGHT
             self.scale_factor = min(scale_x, scale_y)
+            self.inv_scale_factor = 1.0 / self.scale_factor
             self.offset_x = 0
             self.offset_y = 0
             
             # Update UI components with current screen
             if hasattr(self.hud, 'screen'):
-                self.hud.screen = self.screen
+                self.hud.screen = target
             if hasattr(self.game_over_screen, 'screen'):
-                self.game_over_screen.screen = self.screen
+                self.game_over_screen.screen = target
             if hasattr(self.pause_menu, 'screen'):
-                self.pause_menu.screen = self.screen
-                
-            # Clear screen
-            self._clear_screen()
-            
-            # Draw background elements
-            self._draw_background()
-            
-            # Draw game objects
-            self._draw_game_objects(dt)
+                self.pause_menu.screen = target
             
-            # Draw UI
-            self._draw_ui()
+            self._draw_frame(target, dt)
+        # Present do TowerWarGame._render làm - flip ở đây nữa sẽ chờ vblank 2 lần mỗi frame
+    
+    def get_dirty_rects(self) -> list:
+        """
+        Vùng pause menu có thể đổi giữa 2 frame, theo tọa độ screen.
+        Pause menu vẽ ở độ phân giải game nên fullscreen cần scale + offset.
+        """
+        rects = self.pause_menu.get_dirty_rects()
+        if self.offset_x == 0 and self.offset_y == 0 and self.scale_factor == 1.0:
+            return rects
+        scale = self.scale_factor
+        offset_x = self.offset_x
+        offset_y = self.offset_y
+        # +1 bù phần làm tròn khi scale
+        return [pygame.Rect(offset_x + int(r.x * scale), offset_y + int(r.y * scale),
+                            int(r.width * scale) + 1, int(r.height * scale) + 1)
+                for r in rects]
+    
+    def _draw_frame(self, surface: pygame.Surface, dt: float):
+        """Vẽ toàn bộ 1 frame game lên surface"""
+        if self.game_state == GameState.PAUSED:
+            self._draw_paused_frame(surface, dt)
+            return
+        self._paused_frame = None
+        
+        # Clear screen
+        self._clear_screen(surface)
+        
+        # Draw background elements
+        self._draw_background(surface)
         
-        # Update display
-        pygame.display.flip()
+        # Draw game objects
+        self._draw_game_objects(surface, dt)
+        
+        # Draw UI
+        self._draw_ui(surface)
     
-    def _clear_screen(self):
+    def _draw_paused_frame(self, surface: pygame.Surface, dt: float):
+        """
+        Frame khi pause: cảnh bên dưới đứng yên (animations theo ticks không chạy tiếp),
+        chỉ pause menu được vẽ lại - vùng đổi giữa 2 frame chỉ còn buttons (get_dirty_rects)
+        """
+        paused_frame = self._paused_frame
+        if paused_frame is None or paused_frame.get_size() != surface.get_size():
+            self._clear_screen(surface)
+            self._draw_background(surface)
+            self._draw_game_objects(surface, dt)
+            self.hud.draw(surface)
+            self._paused_frame = surface.copy()
+        else:
+            surface.blit(paused_frame, (0, 0))
+        self.pause_menu.draw(surface)
+    
+    def _clear_screen(self, surface: pygame.Surface):
         """Clear screen với background color hoặc background image"""
         if self.background_image:
-            # Scale background to fit current screen size
-            screen_width = self.screen.get_width()
-            screen_height = self.screen.get_height()
-            scaled_bg = pygame.transform.scale(self.background_image, (screen_width, screen_height))
-            self.screen.blit(scaled_bg, (0, 0))
+            # Scale background to fit current screen size - chỉ scale lại khi kích thước đổi
+            size = surface.get_size()
+            if self._scaled_background_size != size:
+                # convert() không alpha: background phủ kín nên blit là copy thẳng pixel
+                self._scaled_background = pygame.transform.scale(self.background_image, size).convert()
+                self._scaled_background_size = size
+            surface.blit(self._scaled_background, (0, 0))
         else:
-            self.screen.fill(self.background_color)
+            surface.fill(self.background_color)
     
-    def _draw_background(self):
+    def _draw_background(self, surface: pygame.Surface):
         """Draw background elements như grid"""
         if self.show_grid:
-            self._draw_grid()
+            self._draw_grid(surface)
     
-    def _draw_grid(self):
+    def _draw_grid(self, surface: pygame.Surface):
         """Draw grid để debug hoặc visual aid"""
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
+        screen_width = surface.get_width()
+        screen_height = surface.get_height()
         
         grid_size = 50
-        grid_color = (230, 230, 230)
+        grid_color = _GRID_COLOR
         
         # Vertical lines
         for x in range(0, screen_width, grid_size):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, screen_height))
+            pygame.draw.line(surface, grid_color, (x, 0), (x, screen_height))
         
         # Horizontal lines
         for y in range(0, screen_height, grid_size):
-            pygame.draw.line(self.screen, grid_color, (0, y), (screen_width, y))
+            pygame.draw.line(surface, grid_color, (0, y), (screen_width, y))
     
-    def _draw_game_objects(self, dt: float):
+    def _draw_game_objects(self, surface: pygame.Surface, dt: float):
         """Draw all game objects"""
         # Update selection pulse effect
         self.selection_pulse_time += dt
         
         # Draw towers
-        self._draw_towers()
+        self._draw_towers(surface)
         
         # Draw troops
-        self._draw_troops()
+        self._draw_troops(surface)
         
         # Draw tower dust animations (when towers change owner)
-        self._draw_tower_dust_animations()
+        self._draw_tower_dust_animations(surface)
         
         # Draw connections for selected tower
-        self._draw_tower_connections()
+        self._draw_tower_connections(surface)
     
-    def _draw_towers(self):
+    def _draw_towers(self, surface: pygame.Surface):
         """Draw all towers with proper scaling"""
         for tower in self.towers:
             if tower.active:
-                self._draw_scaled_tower(tower)
+                self._draw_scaled_tower(surface, tower)
                 # Đã tắt hiệu ứng selection mờ khi chọn tower
     
-    def _draw_scaled_tower(self, tower: Tower):
+    def _draw_scaled_tower(self, surface: pygame.Surface, tower: Tower):
         """Draw a single tower with scaling, including flying rock effect"""
         # Lưu lại các thuộc tính gốc
         orig_x, orig_y = tower.x, tower.y
@@ -443,10 +508,10 @@ class GameView(Observer):
         # Scale radius for text positioning
         tower._Tower__radius = tower._Tower__radius * self.scale_factor
         # Vẽ tower (bao gồm flying rock)
-        tower.draw(self.screen)
+        tower.draw(surface)
         # Vẽ selection highlight nếu cần
         if tower.selected:
-            pygame.draw.circle(self.screen, Colors.WHITE, (int(tower.x), int(tower.y)), int(tower.radius * tower._scale) + 5, 3)
+            pygame.draw.circle(surface, Colors.WHITE, (int(tower.x), int(tower.y)), int(tower.radius * tower._scale) + 5, 3)
         # Vẽ số quân với scale phù hợp (nếu cần override)
         # Khôi phục thuộc tính gốc
         tower.x = orig_x
@@ -454,7 +519,7 @@ class GameView(Observer):
         tower._scale = orig_scale
         tower._Tower__radius = orig_radius
     
-    def _draw_scaled_troops_text(self, tower: Tower, x: int, y: int, radius: int):
+    def _draw_scaled_troops_text(self, surface: pygame.Surface, tower: Tower, x: int, y: int, radius: int):
         """Draw troops text with proper scaling"""
         try:
             font_size = int(GameSettings.FONT_MEDIUM * self.scale_factor)
@@ -471,16 +536,14 @@ class GameView(Observer):
         shadow = font.render(str(tower.troops), True, Colors.BLACK)
         shadow_rect = shadow.get_rect(midbottom=(x + 1, y - radius - int(3 * self.scale_factor)))
         
-        self.screen.blit(shadow, shadow_rect)
-        self.screen.blit(text, text_rect)
+        surface.blit(shadow, shadow_rect)
+        surface.blit(text, text_rect)
     
-    def _draw_selection_effect(self, tower: Tower):
+    def _draw_selection_effect(self, surface: pygame.Surface, tower: Tower):
         """
         Draw selection effect cho selected tower with proper scaling
         Animated pulse effect
         """
-        import math
-        
         # Calculate scaled position and radius
         scaled_x = int(tower.x * self.scale_factor)
         scaled_y = int(tower.y * self.scale_factor)
@@ -505,9 +568,9 @@ class GameView(Observer):
         
         # Blit pulse surface
         pulse_rect = pulse_surface.get_rect(center=(scaled_x, scaled_y))
-        self.screen.blit(pulse_surface, pulse_rect)
+        surface.blit(pulse_surface, pulse_rect)
     
-    def _draw_troops(self):
+    def _draw_troops(self, surface: pygame.Surface):
         """Draw all troops with proper scaling and dead animations"""
         now = pygame.time.get_ticks()
         
@@ -524,23 +587,23 @@ class GameView(Observer):
         # Draw active troops first
         for troop in self.troops:
             if troop.active:
-                self._draw_scaled_troop(troop)
+                self._draw_scaled_troop(surface, troop)
         
         # Then draw dead animations on top
         self.dead_animations[:] = [anim for anim in self.dead_animations if now - anim.start_time < anim_duration(anim)]
         for anim in self.dead_animations:
-            anim.draw(self.screen, now, self.scale_factor)
+            anim.draw(surface, now, self.scale_factor)
     
-    def _draw_tower_dust_animations(self):
+    def _draw_tower_dust_animations(self, surface: pygame.Surface):
         """Draw tower dust animations when towers change owner"""
         now = pygame.time.get_ticks()
         # Clean expired animations (9 frames * 100ms = 900ms)
         self.tower_dust_animations[:] = [anim for anim in self.tower_dust_animations if now - anim.start_time < 900]
         # Draw remaining animations
         for anim in self.tower_dust_animations:
-            anim.draw(self.screen, now, self.scale_factor)
+            anim.draw(surface, now, self.scale_factor)
     
-    def _draw_scaled_troop(self, troop: Troop):
+    def _draw_scaled_troop(self, surface: pygame.Surface, troop: Troop):
         """Draw a single troop with animation, dead troops show death animation without dust"""
         scaled_x = int(troop.x * self.scale_factor)
         scaled_y = int(troop.y * self.scale_factor)
@@ -595,12 +658,10 @@ class GameView(Observer):
                     frame = pygame.transform.flip(frame, True, False)
         
         rect = frame.get_rect(center=(scaled_x, scaled_y))
-        self.screen.blit(frame, rect)
+        surface.blit(frame, rect)
     
-    def _draw_troop_direction_arrow(self, troop: Troop, scaled_x: int, scaled_y: int, scaled_radius: int):
+    def _draw_troop_direction_arrow(self, surface: pygame.Surface, troop: Troop, scaled_x: int, scaled_y: int, scaled_radius: int):
         """Draw direction arrow on troop"""
-        import math
-        
         target_x, target_y = troop.target_position
         
         # Calculate direction vector
@@ -626,7 +687,7 @@ class GameView(Observer):
             arrow_start_y = scaled_y - norm_dy * arrow_length * 0.3
             
             # Draw arrow shaft
-            pygame.draw.line(self.screen, Colors.WHITE, 
+            pygame.draw.line(surface, Colors.WHITE, 
                            (arrow_start_x, arrow_start_y), 
                            (arrow_end_x, arrow_end_y), 
                            max(1, int(2 * self.scale_factor)))
@@ -642,17 +703,15 @@ class GameView(Observer):
             head_y2 = arrow_end_y - arrow_head_size * math.sin(head_angle2)
             
             # Draw arrow head lines
-            pygame.draw.line(self.screen, Colors.WHITE, 
+            pygame.draw.line(surface, Colors.WHITE, 
                            (arrow_end_x, arrow_end_y), (head_x1, head_y1), 
                            max(1, int(2 * self.scale_factor)))
-            pygame.draw.line(self.screen, Colors.WHITE, 
+            pygame.draw.line(surface, Colors.WHITE, 
                            (arrow_end_x, arrow_end_y), (head_x2, head_y2), 
                            max(1, int(2 * self.scale_factor)))
     
-    def _draw_troop_path(self, troop: Troop, scaled_x: int, scaled_y: int):
+    def _draw_troop_path(self, surface: pygame.Surface, troop: Troop, scaled_x: int, scaled_y: int):
         """Draw path line from troops to their actual targets - không vẽ quá xa"""
-        import math
-        
         target_x, target_y = troop.target_position
         
         # Kiểm tra khoảng cách - nếu quá xa thì không vẽ đường
@@ -670,13 +729,13 @@ class GameView(Observer):
         alpha_color = tuple(c // 4 for c in path_color)  # Làm mờ hơn
         
         # Only draw path if target is reasonable
-        self._draw_dashed_line(self.screen, alpha_color,
+        self._draw_dashed_line(surface, alpha_color,
                              (scaled_x, scaled_y),
                              (scaled_target_x, scaled_target_y), 
                              max(1, int(1 * self.scale_factor)), 
                              max(8, int(15 * self.scale_factor)))  # Dash dài hơn
 
-    def _draw_tower_connections(self):
+    def _draw_tower_connections(self, surface: pygame.Surface):
         """
         Draw connections từ selected towers đến các towers khác và preview đến mouse position
         """
@@ -706,7 +765,7 @@ class GameView(Observer):
                     scaled_dash = max(2, int(10 * self.scale_factor))
                     
                     # Draw dashed line with scaling
-                    self._draw_dashed_line(self.screen, line_color,
+                    self._draw_dashed_line(surface, line_color,
                                          (start_x, start_y),
                                          (end_x, end_y), scaled_width, scaled_dash)
         
@@ -730,14 +789,14 @@ class GameView(Observer):
             if mouse_over_tower:
                 # Mouse over a tower - show color based on tower ownership
                 if mouse_over_tower.owner == selected_towers[0].owner:
-                    preview_color = (0, 255, 0, 128)  # Green with alpha
+                    preview_color = _PREVIEW_OWN
                 elif mouse_over_tower.owner == 'neutral':
-                    preview_color = (255, 255, 0, 128)  # Yellow with alpha
+                    preview_color = _PREVIEW_NEUTRAL
                 else:
-                    preview_color = (255, 0, 0, 128)  # Red with alpha
+                    preview_color = _PREVIEW_ENEMY
             else:
                 # Mouse in empty space
-                preview_color = (255, 255, 255, 80)  # White with low alpha
+                preview_color = _PREVIEW_EMPTY
             
             # Draw preview lines từ tất cả selected towers đến mouse
             for selected_tower in selected_towers:
@@ -757,21 +816,19 @@ class GameView(Observer):
                 local_mouse_y = mouse_y - offset_y
                 
                 # Draw preview line on alpha surface
-                pygame.draw.line(preview_surface, preview_color[:3], 
+                pygame.draw.line(preview_surface, preview_color, 
                                (local_start_x, local_start_y), 
                                (local_mouse_x, local_mouse_y), 
                                max(1, int(3 * self.scale_factor)))
                 
                 # Blit alpha surface to main screen
-                self.screen.blit(preview_surface, (offset_x, offset_y))
+                surface.blit(preview_surface, (offset_x, offset_y))
     
     def _draw_dashed_line(self, surface: pygame.Surface, color, start_pos, end_pos, 
                          width: int = 1, dash_length: int = 5):
         """
         Draw dashed line
         """
-        import math
-        
         x1, y1 = start_pos
         x2, y2 = end_pos
         
@@ -803,27 +860,27 @@ class GameView(Observer):
             current_distance = dash_end_distance
             draw_dash = not draw_dash
     
-    def _draw_ui(self):
+    def _draw_ui(self, surface: pygame.Surface):
         """Draw all UI elements"""
         # Draw HUD
-        self.hud.draw(self.screen)
+        self.hud.draw(surface)
         
         # Priority order: Pause menu > Game over (no level complete dialog here)
         if self.game_state == GameState.PAUSED:
             # Draw pause menu if paused (highest priority)
-            self.pause_menu.draw(self.screen)
+            self.pause_menu.draw(surface)
         elif self.game_state == GameState.GAME_OVER:
             # Draw game over screen only for actual game over (not level complete)
-            self.game_over_screen.draw(self.screen)
+            self.game_over_screen.draw(surface)
         # Note: Level complete dialog is handled by main.py's result state
     
-    def _draw_level_complete_dialog(self):
+    def _draw_level_complete_dialog(self, surface: pygame.Surface):
         """Vẽ dialog khi hoàn thành level"""
         # Create dialog surface only once to prevent flickering
         if self._level_complete_surface is None:
             # Get current screen dimensions
-            screen_width = self.screen.get_width()
-            screen_height = self.screen.get_height()
+            screen_width = surface.get_width()
+            screen_height = surface.get_height()
             
             # Create a surface for the entire dialog
             self._level_complete_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
@@ -867,7 +924,7 @@ class GameView(Observer):
             self._level_complete_surface.blit(restart_text, restart_rect)
         
         # Simply blit the cached surface - no flickering
-        self.screen.blit(self._level_complete_surface, (0, 0))
+        surface.blit(self._level_complete_surface, (0, 0))
     
     def draw_debug_info(self, debug_info: dict):
         """
@@ -897,8 +954,8 @@ class GameView(Observer):
         """
         x, y = pos
         # Scale mouse coordinates to match game coordinates
-        game_x = x / self.scale_factor
-        game_y = y / self.scale_factor
+        game_x = x * self.inv_scale_factor
+        game_y = y * self.inv_scale_factor
         
         for tower in self.towers:
             if tower.contains_point(game_x, game_y):
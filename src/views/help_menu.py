@@ -28,6 +28,10 @@ class HelpMenu(UIView):
         """Update mouse position"""
         self.mouse_pos = pos
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame (back button hover)"""
+        return [self.back_button] if self.back_button else []
+    
     def _recalculate_buttons(self, screen_width, screen_height):
         """Recalculate button positions for current screen size"""
         self.back_button = pygame.Rect(screen_width//2 - 100, screen_height - 80, 200, 50)
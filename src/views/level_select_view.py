@@ -103,6 +103,13 @@ class LevelSelectView:
         
         return None
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame (buttons hover)"""
+        rects = [button["rect"] for button in self.level_buttons]
+        if self.back_button:
+            rects.append(self.back_button)
+        return rects
+    
     def _recalculate_buttons(self, screen_width, screen_height):
         """Recalculate button positions for current screen size"""
         button_width = 320  # Tăng từ 250 lên 320 để chữ không bị tràn
@@ -19,6 +19,8 @@ class MainMenu(UIView):
 
         # Background (phải khởi tạo trước)
         self.background = None
+        self._scaled_background = None  # Background đã scale + convert theo kích thước screen
+        self._scaled_background_size = None
         # Image manager
         self.image_manager = ImageManager()
         self._load_background()
@@ -110,6 +112,11 @@ class MainMenu(UIView):
         """Update mouse position cho hover effects"""
         self.mouse_pos = pos
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame (buttons hover/state)"""
+        return [rect for rect in (self.continue_button, self.new_game_button, self.settings_button,
+                                  self.help_button, self.quit_button) if rect]
+    
     def draw(self, screen: pygame.Surface):
         """Vẽ main menu"""
         if not self.visible:
@@ -127,9 +134,12 @@ class MainMenu(UIView):
 
         # Draw background
         if self.background:
-            # Scale background to fit screen
-            scaled_bg = pygame.transform.scale(self.background, (screen_width, screen_height))
-            screen.blit(scaled_bg, (0, 0))
+            # Scale background to fit screen - chỉ scale lại khi kích thước screen đổi
+            screen_size = (screen_width, screen_height)
+            if self._scaled_background_size != screen_size:
+                self._scaled_background = pygame.transform.scale(self.background, screen_size).convert()
+                self._scaled_background_size = screen_size
+            screen.blit(self._scaled_background, (0, 0))
         else:
             screen.fill(Colors.DARK_BLUE)
 
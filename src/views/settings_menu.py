@@ -48,6 +48,10 @@ class SettingsMenu(UIView):
         """Update mouse position"""
         self.mouse_pos = pos
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame (buttons hover/toggle)"""
+        return [rect for rect in (self.sound_button, self.music_button, self.back_button) if rect]
+    
     def _recalculate_buttons(self, screen_width, screen_height):
         """Recalculate button positions for current screen size"""
         # Buttons - căn giữa chính xác
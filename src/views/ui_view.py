@@ -425,8 +425,15 @@ class PauseMenu(UIView, Observer):
         self.sound_button = None
         self.music_button = None
         
+        # Hit test table: list Rect song song với action - dispatch bằng Rect.collidelist
+        self._hitboxes = []
+        self._layout_size = None
+        
         self.mouse_pos = (0, 0)
     
+    # Thứ tự action khớp với self._hitboxes
+    _HITBOX_ACTIONS = ("resume", "restart", "menu", "toggle_sound", "toggle_music")
+    
     def update_observer(self, event_type: str, data: dict):
         """Update pause menu visibility"""
         if event_type == "game_paused":
@@ -450,24 +457,28 @@ class PauseMenu(UIView, Observer):
             screen_width, screen_height = 1024, 576
             self._recalculate_buttons(screen_width, screen_height)
         
-        if self.resume_button.collidepoint(pos):
-            return "resume"
-        elif self.restart_button.collidepoint(pos):
-            return "restart"
-        elif self.menu_button.collidepoint(pos):
-            return "menu"
-        elif self.sound_button.collidepoint(pos):
-            return "toggle_sound"
-        elif self.music_button.collidepoint(pos):
-            return "toggle_music"
-        return None
+        index = pygame.Rect(pos, (1, 1)).collidelist(self._hitboxes)
+        if index < 0:
+            return None
+        return self._HITBOX_ACTIONS[index]
     
     def update_mouse_pos(self, pos: Tuple[int, int]):
         """Update mouse position"""
         self.mouse_pos = pos
     
+    def get_dirty_rects(self) -> list:
+        """Các vùng có thể thay đổi giữa 2 frame khi đang pause (buttons hover/toggle)"""
+        if not self.visible:
+            return []
+        return self._hitboxes
+    
     def _recalculate_buttons(self, screen_width, screen_height):
         """Recalculate button positions for current screen size"""
+        # Layout chỉ phụ thuộc kích thước màn hình - giữ nguyên nếu không đổi
+        if self._layout_size == (screen_width, screen_height):
+            return
+        self._layout_size = (screen_width, screen_height)
+        
         # Buttons - làm lớn hơn và thêm sound controls
         button_width, button_height = 250, 60  # Tăng từ 200x50 lên 250x60
         center_x = screen_width // 2 - button_width // 2
@@ -484,6 +495,9 @@ class PauseMenu(UIView, Observer):
         
         self.sound_button = pygame.Rect(sound_start_x, sound_y, sound_button_width, sound_button_height)
         self.music_button = pygame.Rect(sound_start_x + 170, sound_y, sound_button_width, sound_button_height)  # Tăng spacing từ 150 lên 170
+        
+        self._hitboxes = [self.resume_button, self.restart_button, self.menu_button,
+                          self.sound_button, self.music_button]
     
     def draw(self, screen: pygame.Surface):
         """Draw pause menu"""